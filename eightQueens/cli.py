@@ -0,0 +1,501 @@
+"""
+Command-line entry point that runs experiments described by JSON/TOML specs.
+
+Usage:
+    python cli.py run experiments/part_1_selection.json [--runs 5] [--output my_folder] [--metrics-port 9100]
+    python cli.py strategies
+    python cli.py startup-time [--repeats 10]
+    python cli.py backends [--n 8 16 32] [--population-size 200]
+    python cli.py threads [--n 32] [--workers 4]
+    python cli.py baseline [--n 10 20 30 40] [--runs 2] [--time-limit 60]
+    python cli.py allocations [--n 30] [--population-size 200] [--generations 100]
+    python cli.py schedule experiments/part_5_scalability.json [--workers 4] [--order lpt|spec]
+    python cli.py serve [--port 8765] [--unix /tmp/nqueens.sock] [--workers 4]
+    python cli.py loadtest [--port 8765] [--requests 200] [--concurrency 50] [--n 8 10 12]
+
+A spec looks like:
+    {
+      "folder": "part_1_selection",          # output folder inside results/
+      "num_runs": 20,
+      "params": {"n_queens": 10},            # overrides of main.BASE_PARAMS
+      "n_values": [10, 15],                  # optional: repeat every config for each N
+      "log_generations": true,               # write one CSV per run
+      "configs": [
+        {"name": "Tournament",
+         "params": {"mutation_rate": 0.1},   # optional per-config overrides
+         "selection": {"type": "Tournament", "tournament_size": 3},
+         "crossover": "Uniform", "mutation": "Swap",
+         "elitism": {"type": "BestN", "n": 2},
+         "initialization": "Permutation",     # optional, defaults to "Random"
+         "replacement": "Unique"}             # optional, defaults to "Generational"
+      ]
+    }
+
+Heavy dependencies (pandas, tqdm) are only imported when results are written
+or progress is shown, so short runs and worker processes start quickly.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+
+def load_spec(path: str) -> dict:
+    """Loads an experiment spec from a .json or .toml file."""
+    if path.endswith(".toml"):
+        import tomllib  # Python 3.11+
+        with open(path, "rb") as f:
+            return tomllib.load(f)
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def build_configs(spec: dict, folder: str, n_queens: int) -> list:
+    """Turns the configs of a spec into the config dicts used by run_single_experiment."""
+    from main import BASE_PARAMS
+    from ga.strategies.registry import build_strategy
+
+    params = {**BASE_PARAMS, **spec.get("params", {}), "n_queens": n_queens}
+    configs = []
+    for config_spec in spec["configs"]:
+        configs.append({
+            "name": config_spec["name"],
+            "folder": folder,
+            "params": {**params, **config_spec.get("params", {})},
+            "selection": build_strategy("selection", config_spec["selection"]),
+            "crossover": build_strategy("crossover", config_spec["crossover"]),
+            "mutation": build_strategy("mutation", config_spec["mutation"]),
+            "elitism": build_strategy("elitism", config_spec["elitism"]),
+            "initialization": build_strategy("initialization", config_spec.get("initialization", "Random")),
+            "replacement": build_strategy("replacement", config_spec.get("replacement", "Generational")),
+        })
+    return configs
+
+
+def run_spec(spec: dict, num_runs: int = None, folder: str = None, quiet: bool = False) -> list:
+    """Runs every configuration of a spec and saves the experiment summary."""
+    from main import BASE_PARAMS, RESULTS_DIR, run_single_experiment, save_summary, progress
+
+    folder = folder or spec["folder"]
+    os.makedirs(os.path.join(RESULTS_DIR, folder), exist_ok=True)
+    num_runs = num_runs or spec.get("num_runs", BASE_PARAMS["num_runs"])
+    n_values = spec.get("n_values")
+    log_generations = spec.get("log_generations", True)
+
+    summary_results = []
+    for n in n_values or [spec.get("params", {}).get("n_queens", BASE_PARAMS["n_queens"])]:
+        for config in build_configs(spec, folder, n):
+            runs = range(num_runs) if quiet else progress(range(num_runs), f"Runs for {config['name']} (N={n})")
+            for i in runs:
+                result = run_single_experiment(config, i, show_progress=not log_generations)
+                if n_values:
+                    result["n_queens"] = n
+                summary_results.append(result)
+
+    save_summary(summary_results, folder)
+    if not quiet:
+        print(f"Summary saved to {os.path.join(RESULTS_DIR, folder, 'summary.csv')}")
+    return summary_results
+
+
+def _run_scheduled_job(job: tuple) -> tuple:
+    """Worker-process entry point of schedule_spec: runs one (config, N, run) job."""
+    from main import execute_run
+
+    config_spec, spec_params, folder, n, run_id, show_progress = job
+    config = build_configs({"params": spec_params, "configs": [config_spec]}, folder, n)[0]
+    start = time.time()
+    result, best_solution = execute_run(config, run_id, show_progress)
+    return result, list(best_solution.chromosome), start, time.time(), os.getpid()
+
+
+def schedule_spec(spec: dict, num_workers: int = None, order: str = "lpt", num_runs: int = None,
+                  folder: str = None, quiet: bool = False) -> list:
+    """
+    Runs every (config, N, run) job of a spec on a pool of worker processes.
+
+    Each job's execution time is predicted by a RuntimeModel fitted to the
+    summaries already in results/. With order="lpt" jobs are submitted
+    longest-predicted-first, which keeps the long large-N runs from being
+    left for the end when most workers are idle; order="spec" keeps the
+    spec's order. The summary is saved as usual, and results/<folder>/schedule.csv
+    records the predicted and actual duration and finish time of every job.
+    Returns the schedule rows.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from main import BASE_PARAMS, RESULTS_DIR, archive_run, save_summary
+    from utils.runtime_model import RuntimeModel, load_runtime_history, lpt_order, simulate_makespan
+
+    # History is read from the same results directory the summaries are written to.
+    results_dir = os.path.abspath(RESULTS_DIR)
+    specs_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "experiments")
+    model = RuntimeModel.fit(load_runtime_history(results_dir, specs_dir, BASE_PARAMS))
+
+    folder = folder or spec["folder"]
+    os.makedirs(os.path.join(results_dir, folder), exist_ok=True)
+    num_runs = num_runs or spec.get("num_runs", BASE_PARAMS["num_runs"])
+    num_workers = num_workers or os.cpu_count() or 1
+    spec_params = spec.get("params", {})
+    show_progress = not spec.get("log_generations", True)
+
+    jobs, predicted = [], []
+    for n in spec.get("n_values") or [spec_params.get("n_queens", BASE_PARAMS["n_queens"])]:
+        for config_spec, config in zip(spec["configs"], build_configs(spec, folder, n)):
+            params = config["params"]
+            for i in range(num_runs):
+                jobs.append((config_spec, spec_params, folder, n, i, show_progress))
+                predicted.append(model.predict(n, params["population_size"], params["num_generations"],
+                                               config["name"]))
+    job_order = lpt_order(predicted) if order == "lpt" else list(range(len(jobs)))
+    predicted_makespan, predicted_finish = simulate_makespan(predicted, job_order, num_workers)
+    if not quiet:
+        print(f"Runtime model fitted on {model.num_samples} past runs (time ~ N^{model.n_exponent:.2f}); "
+              f"{len(jobs)} jobs on {num_workers} workers, {order} order")
+
+    suite_start = time.time()
+    outputs = [None] * len(jobs)
+    with ProcessPoolExecutor(max_workers=num_workers) as pool:
+        # The pool hands queued jobs to workers in submission order, so this is list scheduling.
+        futures = {pool.submit(_run_scheduled_job, jobs[index]): index for index in job_order}
+        for future, index in futures.items():
+            outputs[index] = future.result()
+    makespan = time.time() - suite_start
+
+    summary_results, schedule_rows = [], []
+    for index, (result, chromosome, start, end, pid) in enumerate(outputs):
+        config_spec, _, _, n, run_id, _ = jobs[index]
+        archive_run(result, chromosome, {"folder": folder, "name": config_spec["name"]})
+        summary_results.append(result)
+        schedule_rows.append({
+            "config_name": config_spec["name"], "n_queens": n, "run_id": run_id,
+            "submit_position": job_order.index(index), "worker_pid": pid,
+            "predicted_time": predicted[index], "actual_time": end - start,
+            "predicted_finish": predicted_finish[index], "actual_finish": end - suite_start,
+        })
+    save_summary(summary_results, folder)
+    save_summary(schedule_rows, folder, "schedule.csv")
+
+    if not quiet:
+        actual = [row["actual_time"] for row in schedule_rows]
+        spec_makespan, _ = simulate_makespan(actual, range(len(jobs)), num_workers)
+        lpt_makespan, _ = simulate_makespan(actual, lpt_order(actual), num_workers)
+        error = sum(abs(row["predicted_time"] - row["actual_time"]) / row["actual_time"]
+                    for row in schedule_rows) / len(schedule_rows)
+        print(f"Makespan: predicted {predicted_makespan:.1f}s, actual {makespan:.1f}s "
+              f"(mean per-job prediction error {error:.0%})")
+        print(f"With the actual job times, spec order would take {spec_makespan:.1f}s "
+              f"and LPT order {lpt_makespan:.1f}s on {num_workers} workers")
+        print(f"Schedule saved to {os.path.join(results_dir, folder, 'schedule.csv')}")
+    return schedule_rows
+
+
+def measure_startup_time(repeats: int = 10) -> dict:
+    """
+    Measures the wall-clock time to start a fresh interpreter and import the CLI,
+    compared with a bare interpreter and with the heavy dependencies loaded eagerly.
+    Returns the median time in milliseconds for each case.
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    cases = {
+        "python": "pass",
+        "cli": "import cli, main",
+        "cli + pandas/tqdm (eager)": "import cli, main, pandas, tqdm",
+    }
+    results = {}
+    for label, code in cases.items():
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, "-c", code], cwd=here, check=True)
+            timings.append((time.perf_counter() - start) * 1000)
+        timings.sort()
+        results[label] = timings[len(timings) // 2]
+    return results
+
+
+def benchmark_backends(n_values=(8, 16, 32), population_size: int = 200, repeats: int = 20) -> list:
+    """
+    Times each kernel of every available backend on the same inputs
+    (correctness is covered by tests/test_backends.py). Returns one row per backend and N
+    with the mean time per call in microseconds.
+    """
+    import random
+    from ga.backends import BACKENDS, get_backend
+
+    rows = []
+    for name, backend_cls in BACKENDS.items():
+        if not backend_cls.is_available():
+            print(f"{name}: not installed, skipped")
+            continue
+        backend = get_backend(name, seed=0)
+        backend.attacking_pairs([[0] * 4])  # triggers JIT compilation before timing
+        for n in n_values:
+            boards = [[random.randrange(n) for _ in range(n)] for _ in range(population_size)]
+            fitnesses = [float(random.randrange(100)) for _ in range(population_size)]
+            kernels = {
+                "fitness (batch)": lambda: backend.attacking_pairs(boards),
+                "tournament": lambda: backend.tournament_select(fitnesses, population_size, 3),
+                "roulette": lambda: backend.roulette_select(fitnesses, population_size),
+                "uniform crossover": lambda: backend.uniform_crossover(boards[0], boards[1], 0.5),
+                "two-point crossover": lambda: backend.two_point_crossover(boards[0], boards[1]),
+                "swap mutation": lambda: backend.swap_positions(n),
+            }
+            row = {"backend": name, "n": n}
+            for label, kernel in kernels.items():
+                start = time.perf_counter()
+                for _ in range(repeats):
+                    kernel()
+                row[label] = (time.perf_counter() - start) / repeats * 1e6
+            rows.append(row)
+    return rows
+
+
+def benchmark_offspring_parallelism(n: int = 32, population_size: int = 400, num_workers: int = 4,
+                                    repeats: int = 10) -> dict:
+    """
+    Times the production (crossover + mutation + evaluation) of one generation
+    of offspring serially, on a thread pool and on a process pool. Threads
+    only speed this up on a free-threaded build; processes pay for pickling
+    parents and children on every generation. Returns milliseconds per generation.
+    """
+    import random
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+    from core.population import Population
+    from ga.backends import PYTHON_BACKEND
+    from ga.parallel import OffspringWorker, produce_offspring_chunk
+    from ga.strategies.crossover import UniformCrossover
+    from ga.strategies.mutation import SwapMutation
+
+    population = Population.generate_initial_population(population_size, n)
+    parents = population.individuals
+    pairs = [(parents[i], parents[i + 1]) for i in range(0, population_size, 2)]
+    chunk_size = -(-len(pairs) // num_workers)
+    chunks = [pairs[i:i + chunk_size] for i in range(0, len(pairs), chunk_size)]
+    crossover, mutation, mutation_rate = UniformCrossover(), SwapMutation(), 0.05
+    workers = [OffspringWorker(PYTHON_BACKEND.spawn(random.getrandbits(32)), crossover, mutation, n)
+               for _ in range(num_workers)]
+
+    def timed(produce_generation):
+        produce_generation()  # warm-up (pool start-up is not counted)
+        start = time.perf_counter()
+        for _ in range(repeats):
+            produce_generation()
+        return (time.perf_counter() - start) / repeats * 1000
+
+    results = {"serial": timed(lambda: workers[0].produce(pairs, mutation_rate))}
+    with ThreadPoolExecutor(max_workers=num_workers) as pool:
+        results["threads"] = timed(lambda: list(pool.map(
+            lambda job: job[0].produce(job[1], mutation_rate), zip(workers, chunks))))
+    with ProcessPoolExecutor(max_workers=num_workers) as pool:
+        results["processes"] = timed(lambda: list(pool.map(produce_offspring_chunk, [
+            ((PYTHON_BACKEND.spawn(random.getrandbits(32)), crossover, mutation, n),
+             [(a.chromosome, b.chromosome) for a, b in chunk], mutation_rate)
+            for chunk in chunks
+        ])))
+    return results
+
+
+def run_exact_baseline(spec: dict, n_values, num_runs: int = 2, time_limit: float = 60.0,
+                       folder: str = "exact_baseline") -> list:
+    """
+    Measures time-to-first-solution of the exact solvers (constructive and
+    bitmask backtracking) and of every GA configuration of `spec` for each N,
+    and saves one row per attempt to results/<folder>/summary.csv.
+    Backtracking attempts that exceed `time_limit` are recorded as unsolved.
+    """
+    from main import RESULTS_DIR, run_single_experiment, save_summary
+    from problem.exact_solvers import SearchLimitReached, backtracking_solution, constructive_solution
+
+    os.makedirs(os.path.join(RESULTS_DIR, folder), exist_ok=True)
+    rows = []
+    for n in n_values:
+        start = time.perf_counter()
+        constructive_solution(n)
+        rows.append({"method": "Constructive", "n_queens": n, "run_id": 0,
+                     "execution_time": time.perf_counter() - start, "solution_found": True})
+
+        start = time.perf_counter()
+        try:
+            solved = backtracking_solution(n, time_limit=time_limit) is not None
+        except SearchLimitReached:
+            solved = False
+        rows.append({"method": "Backtracking", "n_queens": n, "run_id": 0,
+                     "execution_time": time.perf_counter() - start, "solution_found": solved})
+
+        for config in build_configs(spec, folder, n):
+            for i in range(num_runs):
+                result = run_single_experiment(config, i, show_progress=True)
+                rows.append({"method": config["name"], "n_queens": n, "run_id": i,
+                             "execution_time": result["execution_time"],
+                             "solution_found": result["solution_found"]})
+    save_summary(rows, folder)
+    return rows
+
+
+def measure_generation_allocations(n: int = 30, population_size: int = 200, num_generations: int = 100) -> dict:
+    """
+    Runs the same seeded GA with and without double-buffered populations under
+    tracemalloc and returns, for each, the mean allocated bytes, retained
+    bytes, GC collections and GC pause per generation.
+    """
+    import random
+    from ga.genetic_algorithm import GeneticAlgorithm
+    from ga.strategies.selection import TournamentSelection
+    from ga.strategies.crossover import UniformCrossover
+    from ga.strategies.mutation import SwapMutation
+    from ga.strategies.elitism import BestNElitism
+    from utils.memory_profile import AllocationProbe
+
+    results = {}
+    for label, double_buffered in (("allocating", False), ("double-buffered", True)):
+        random.seed(0)
+        ga = GeneticAlgorithm(n, TournamentSelection(3), UniformCrossover(), SwapMutation(), BestNElitism(2),
+                              double_buffered=double_buffered)
+        probe = AllocationProbe()
+        ga.run(population_size, num_generations, 0.05, metrics=probe)
+        results[label] = probe.summary()
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run N-Queens GA experiments from spec files.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run one or more experiment specs.")
+    run_parser.add_argument("specs", nargs="+", help="Paths to .json or .toml spec files.")
+    run_parser.add_argument("--runs", type=int, help="Override the number of runs per configuration.")
+    run_parser.add_argument("--output", help="Override the output folder inside results/.")
+    run_parser.add_argument("--quiet", action="store_true", help="Do not show progress bars.")
+    run_parser.add_argument("--metrics-port", type=int,
+                            help="Serve live Prometheus metrics on http://127.0.0.1:<port>/metrics.")
+
+    subparsers.add_parser("strategies", help="List the strategies available to specs.")
+
+    startup_parser = subparsers.add_parser("startup-time", help="Measure interpreter + CLI startup time.")
+    startup_parser.add_argument("--repeats", type=int, default=10)
+
+    backends_parser = subparsers.add_parser("backends", help="Verify and benchmark the compute backends.")
+    backends_parser.add_argument("--n", type=int, nargs="+", default=[8, 16, 32], help="Board sizes.")
+    backends_parser.add_argument("--population-size", type=int, default=200)
+
+    threads_parser = subparsers.add_parser("threads", help="Benchmark thread- vs process-parallel offspring production.")
+    threads_parser.add_argument("--n", type=int, default=32)
+    threads_parser.add_argument("--population-size", type=int, default=400)
+    threads_parser.add_argument("--workers", type=int, default=4)
+
+    baseline_parser = subparsers.add_parser("baseline", help="Compare exact solvers with the champion GA configs.")
+    baseline_parser.add_argument("--spec", default=os.path.join("experiments", "part_5_scalability.json"),
+                                 help="Spec whose configs and parameters are used for the GA runs.")
+    baseline_parser.add_argument("--n", type=int, nargs="+", help="Board sizes (defaults to the spec's n_values).")
+    baseline_parser.add_argument("--runs", type=int, default=2, help="GA runs per configuration and N.")
+    baseline_parser.add_argument("--time-limit", type=float, default=60.0, help="Backtracking budget in seconds.")
+
+    allocations_parser = subparsers.add_parser("allocations", help="Measure per-generation allocations and GC.")
+    allocations_parser.add_argument("--n", type=int, default=30)
+    allocations_parser.add_argument("--population-size", type=int, default=200)
+    allocations_parser.add_argument("--generations", type=int, default=100)
+
+    schedule_parser = subparsers.add_parser(
+        "schedule", help="Run a spec on worker processes, longest predicted jobs first.")
+    schedule_parser.add_argument("spec", help="Path to a .json or .toml spec file.")
+    schedule_parser.add_argument("--workers", type=int, help="Worker processes (defaults to the CPU count).")
+    schedule_parser.add_argument("--order", choices=["lpt", "spec"], default="lpt",
+                                 help="Submit jobs longest-predicted-first or in spec order.")
+    schedule_parser.add_argument("--runs", type=int, help="Override the number of runs per configuration.")
+    schedule_parser.add_argument("--output", help="Override the output folder inside results/.")
+
+    serve_parser = subparsers.add_parser("serve", help="Run the local solver service (see service.py).")
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8765)
+    serve_parser.add_argument("--unix", help="Listen on this Unix socket path instead of TCP.")
+    serve_parser.add_argument("--workers", type=int, help="GA worker processes (defaults to the CPU count).")
+    serve_parser.add_argument("--no-archive", action="store_true",
+                              help="Do not pre-fill the cache from (or save to) the solution archive.")
+
+    loadtest_parser = subparsers.add_parser("loadtest", help="Send concurrent solve requests to a running service.")
+    loadtest_parser.add_argument("--host", default="127.0.0.1")
+    loadtest_parser.add_argument("--port", type=int, default=8765)
+    loadtest_parser.add_argument("--unix", help="Connect to this Unix socket path instead of TCP.")
+    loadtest_parser.add_argument("--requests", type=int, default=200)
+    loadtest_parser.add_argument("--concurrency", type=int, default=50)
+    loadtest_parser.add_argument("--n", type=int, nargs="+", default=[8, 10, 12], help="Board sizes to request.")
+    loadtest_parser.add_argument("--time-budget", type=float, default=10.0, help="Per-request budget in seconds.")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        if args.metrics_port is not None:
+            from main import enable_metrics
+            enable_metrics(args.metrics_port)
+        for path in args.specs:
+            run_spec(load_spec(path), num_runs=args.runs, folder=args.output, quiet=args.quiet)
+    elif args.command == "schedule":
+        schedule_spec(load_spec(args.spec), args.workers, args.order, args.runs, args.output)
+    elif args.command == "serve":
+        import asyncio
+        from service import SolverService
+        archive = None
+        if not args.no_archive:
+            from main import SOLUTION_ARCHIVE as archive
+        service = SolverService(args.workers, archive)
+        print(f"Serving on {args.unix or f'http://{args.host}:{args.port}'} (Ctrl+C to stop)")
+        try:
+            asyncio.run(service.serve(args.host, args.port, args.unix))
+        except KeyboardInterrupt:
+            pass
+        finally:
+            service.close()
+    elif args.command == "loadtest":
+        import asyncio
+        from service import run_load_test
+        report = asyncio.run(run_load_test(args.n, args.requests, args.concurrency, args.time_budget,
+                                           args.host, args.port, args.unix))
+        print(f"{report['requests']} requests: {report['requests_per_second']:.1f} req/s, latency "
+              f"p50 {report['latency_p50_ms']:.1f} ms, p95 {report['latency_p95_ms']:.1f} ms, "
+              f"max {report['latency_max_ms']:.1f} ms")
+        print(f"Outcomes (status/source): {report['outcomes']}")
+        print(f"Service counters: {report['service_stats']}")
+    elif args.command == "strategies":
+        from ga.strategies.registry import STRATEGY_REGISTRY
+        for kind, strategies in STRATEGY_REGISTRY.items():
+            print(f"{kind}: {', '.join(sorted(strategies))}")
+    elif args.command == "startup-time":
+        for label, ms in measure_startup_time(args.repeats).items():
+            print(f"{label:<28} {ms:8.1f} ms (median of {args.repeats})")
+    elif args.command == "backends":
+        rows = benchmark_backends(args.n, args.population_size)
+        columns = [key for key in rows[0] if key not in ("backend", "n")]
+        print(f"{'backend':<8} {'N':>4} " + " ".join(f"{c:>20}" for c in columns) + "   (us/call)")
+        for row in rows:
+            print(f"{row['backend']:<8} {row['n']:>4} " + " ".join(f"{row[c]:>20.1f}" for c in columns))
+    elif args.command == "threads":
+        from ga.parallel import free_threading_available
+        build = "free-threaded" if free_threading_available() else "GIL (threaded GA mode runs serially)"
+        print(f"Python {sys.version.split()[0]}, {build}")
+        results = benchmark_offspring_parallelism(args.n, args.population_size, args.workers)
+        for label, ms in results.items():
+            print(f"{label:<10} {ms:8.2f} ms/generation  (speedup x{results['serial'] / ms:.2f})")
+    elif args.command == "allocations":
+        results = measure_generation_allocations(args.n, args.population_size, args.generations)
+        print(f"{'population':<16} {'allocated KiB':>14} {'retained KiB':>13} {'GC collections':>15} {'GC pause ms':>12}"
+              "   (mean per generation)")
+        for label, row in results.items():
+            print(f"{label:<16} {row['allocated_bytes'] / 1024:>14.1f} {row['retained_bytes'] / 1024:>13.1f} "
+                  f"{row['gc_collections']:>15.2f} {row['gc_pause_ms']:>12.3f}")
+    elif args.command == "baseline":
+        spec = load_spec(args.spec)
+        rows = run_exact_baseline(spec, args.n or spec["n_values"], args.runs, args.time_limit)
+        print(f"{'method':<24} {'N':>4} {'solved':>7} {'mean time to solution (s)':>27}")
+        groups = {}
+        for row in rows:
+            groups.setdefault((row["method"], row["n_queens"]), []).append(row)
+        for (method, n), group in groups.items():
+            solved_times = [row["execution_time"] for row in group if row["solution_found"]]
+            mean_time = f"{sum(solved_times) / len(solved_times):.6f}" if solved_times else "-"
+            print(f"{method:<24} {n:>4} {len(solved_times):>3}/{len(group):<3} {mean_time:>27}")
+
+
+if __name__ == "__main__":
+    main()
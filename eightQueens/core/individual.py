@@ -5,20 +5,69 @@ class Individual:
     Represents an individual in the population.
     An individual is a potential solution to the N-Queens problem.
 
+    Genes should be changed through `set_gene`, `swap_genes`, `writable_genes`
+    or `copy_from`, which mark the individual as dirty so the fitness
+    evaluator knows it has to be scored again.
+
     Attributes:
         chromosome (List[int]): A list of integers representing the board state.
                                 The index represents the column, and the value
                                 represents the row where a queen is placed.
+                                Writing to this list directly (e.g.
+                                `ind.chromosome[i] = x`) does NOT mark the
+                                individual dirty, so its fitness goes stale;
+                                assign a new list to `chromosome` or use the
+                                methods above instead.
         fitness (float): The fitness score of the individual. Initialized to -1.
+        dirty (bool): True while `fitness` does not reflect the current chromosome.
     """
     def __init__(self, chromosome: List[int]):
         if not all(isinstance(gene, int) for gene in chromosome):
             raise ValueError("Chromosome must contain only integers.")
-        self.chromosome = chromosome
+        self._chromosome = chromosome
         self.fitness = -1.0
+        self.dirty = True
+
+    @property
+    def chromosome(self) -> List[int]:
+        """The gene list. Treat it as read-only: direct writes leave `dirty` unchanged."""
+        return self._chromosome
+
+    @chromosome.setter
+    def chromosome(self, chromosome: List[int]):
+        self._chromosome = chromosome
+        self.dirty = True
+
+    def copy_from(self, other: "Individual"):
+        """
+        Overwrites this individual's genes, fitness and dirty flag with another's,
+        reusing its own gene storage (used to fill preallocated population slots).
+        """
+        self._chromosome[:] = other._chromosome
+        self.fitness = other.fitness
+        self.dirty = other.dirty
+
+    def writable_genes(self) -> List[int]:
+        """
+        Returns the gene list for in-place writing (e.g. by crossover kernels)
+        and marks the individual for re-evaluation.
+        """
+        self.dirty = True
+        return self._chromosome
+
+    def set_gene(self, index: int, value: int):
+        """Writes a single gene and marks the individual for re-evaluation."""
+        self._chromosome[index] = value
+        self.dirty = True
+
+    def swap_genes(self, index1: int, index2: int):
+        """Swaps two genes and marks the individual for re-evaluation."""
+        chromosome = self._chromosome
+        chromosome[index1], chromosome[index2] = chromosome[index2], chromosome[index1]
+        self.dirty = True
 
     def __len__(self) -> int:
-        return len(self.chromosome)
+        return len(self._chromosome)
 
     def __repr__(self) -> str:
-        return f"Individual(chromosome={self.chromosome}, fitness={self.fitness:.2f})"
\ No newline at end of file
+        return f"Individual(chromosome={self._chromosome}, fitness={self.fitness:.2f})"
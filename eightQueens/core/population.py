@@ -13,17 +13,24 @@ class Population:
         self.individuals = individuals
 
     @classmethod
-    def generate_initial_population(cls, population_size: int, n_queens: int):
+    def generate_initial_population(cls, population_size: int, n_queens: int, initializer=None):
         """
         Creates a new population with random individuals.
 
         Args:
             population_size (int): The number of individuals in the population.
             n_queens (int): The size of the N-Queens problem (board size).
+            initializer (InitializationStrategy): Optional strategy that builds the
+                                                  chromosomes. Defaults to uniformly
+                                                  random genes.
 
         Returns:
             Population: A new Population object.
         """
+        if initializer is not None:
+            chromosomes = initializer.create_chromosomes(population_size, n_queens)
+            return cls([Individual(chromosome) for chromosome in chromosomes])
+
         individuals = []
         for _ in range(population_size):
             chromosome = [random.randint(0, n_queens - 1) for _ in range(n_queens)]
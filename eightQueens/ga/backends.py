@@ -0,0 +1,319 @@
+import copy
+import random
+import warnings
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+class ComputeBackend:
+    """
+    Pure Python implementation of the numeric kernels used by the GA.
+
+    Strategies and the fitness calculator delegate their inner loops to a
+    backend, so alternative implementations (NumPy, Numba) can be swapped in
+    at GeneticAlgorithm construction. Kernels work on plain gene lists and
+    fitness lists and always return plain Python ints, so results can be
+    written back into Individuals unchanged.
+    """
+    name = "python"
+
+    def __init__(self, seed: Optional[int] = None):
+        # Without a seed the global `random` module is used, so random.seed() keeps working.
+        self.rng = random if seed is None else random.Random(seed)
+
+    @staticmethod
+    def is_available() -> bool:
+        return True
+
+    def spawn(self, seed: int) -> "ComputeBackend":
+        """Returns a backend of the same kind with its own independent RNG (e.g. one per thread)."""
+        return type(self)(seed)
+
+    def attacking_pairs(self, chromosomes: Sequence[Sequence[int]]) -> List[int]:
+        """Returns the number of attacking queen pairs for each chromosome."""
+        results = []
+        for chromosome in chromosomes:
+            n = len(chromosome)
+            attacking_pairs = 0
+            for i in range(n):
+                for j in range(i + 1, n):
+                    if chromosome[i] == chromosome[j]:
+                        attacking_pairs += 1
+                    elif abs(i - j) == abs(chromosome[i] - chromosome[j]):
+                        attacking_pairs += 1
+            results.append(attacking_pairs)
+        return results
+
+    def tournament_select(self, fitnesses: Sequence[float], num_parents: int, tournament_size: int) -> List[int]:
+        """Returns the indices of the tournament winners."""
+        indices = range(len(fitnesses))
+        winners = []
+        for _ in range(num_parents):
+            contenders = self.rng.sample(indices, tournament_size)
+            winners.append(max(contenders, key=lambda i: fitnesses[i]))
+        return winners
+
+    def roulette_select(self, fitnesses: Sequence[float], num_parents: int) -> List[int]:
+        """Returns indices drawn with probability proportional to fitness."""
+        indices = range(len(fitnesses))
+        if sum(fitnesses) == 0:
+            return self.rng.choices(indices, k=num_parents)
+        return self.rng.choices(indices, weights=fitnesses, k=num_parents)
+
+    def uniform_crossover(self, genes1: Sequence[int], genes2: Sequence[int],
+                          mixing_ratio: float) -> Tuple[List[int], List[int]]:
+        """Each gene of child1 comes from parent1 with probability `mixing_ratio`."""
+        child1, child2 = [], []
+        for g1, g2 in zip(genes1, genes2):
+            if self.rng.random() < mixing_ratio:
+                child1.append(g1)
+                child2.append(g2)
+            else:
+                child1.append(g2)
+                child2.append(g1)
+        return child1, child2
+
+    def two_point_crossover(self, genes1: Sequence[int], genes2: Sequence[int]) -> Tuple[List[int], List[int]]:
+        """Exchanges the segment between two random cut points (requires len >= 3)."""
+        point1, point2 = sorted(self.rng.sample(range(1, len(genes1)), 2))
+        child1 = list(genes1[:point1]) + list(genes2[point1:point2]) + list(genes1[point2:])
+        child2 = list(genes2[:point1]) + list(genes1[point1:point2]) + list(genes2[point2:])
+        return child1, child2
+
+    def uniform_crossover_into(self, genes1: Sequence[int], genes2: Sequence[int],
+                               out1: List[int], out2: List[int], mixing_ratio: float):
+        """In-place variant of uniform_crossover: writes the children into out1/out2."""
+        rng = self.rng
+        for i in range(len(genes1)):
+            if rng.random() < mixing_ratio:
+                out1[i] = genes1[i]
+                out2[i] = genes2[i]
+            else:
+                out1[i] = genes2[i]
+                out2[i] = genes1[i]
+
+    def two_point_crossover_into(self, genes1: Sequence[int], genes2: Sequence[int],
+                                 out1: List[int], out2: List[int]):
+        """In-place variant of two_point_crossover: writes the children into out1/out2."""
+        point1, point2 = sorted(self.rng.sample(range(1, len(genes1)), 2))
+        for i in range(len(genes1)):
+            if point1 <= i < point2:
+                out1[i] = genes2[i]
+                out2[i] = genes1[i]
+            else:
+                out1[i] = genes1[i]
+                out2[i] = genes2[i]
+
+    def swap_positions(self, size: int) -> Tuple[int, int]:
+        """Returns two distinct gene positions to swap."""
+        idx1, idx2 = self.rng.sample(range(size), 2)
+        return idx1, idx2
+
+    def reset_gene(self, size: int) -> Tuple[int, int]:
+        """Returns a (position, new value) pair for random resetting."""
+        return self.rng.randint(0, size - 1), self.rng.randint(0, size - 1)
+
+
+class NumpyBackend(ComputeBackend):
+    """
+    Vectorized kernels. Fitness is evaluated for the whole batch at once with
+    a (population x pairs) boolean array, which is where NumPy pays off.
+    """
+    name = "numpy"
+
+    def __init__(self, seed: Optional[int] = None):
+        import numpy as np
+        self._np = np
+        self.rng = np.random.default_rng(seed)
+        self._pair_cache: Dict[int, tuple] = {}
+
+    @staticmethod
+    def is_available() -> bool:
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def _pairs(self, n: int):
+        """Returns the (i, j, j - i) index arrays of all column pairs for board size n."""
+        if n not in self._pair_cache:
+            i, j = self._np.triu_indices(n, 1)
+            self._pair_cache[n] = (i, j, j - i)
+        return self._pair_cache[n]
+
+    def attacking_pairs(self, chromosomes: Sequence[Sequence[int]]) -> List[int]:
+        np = self._np
+        if len(chromosomes) == 0:
+            return []
+        boards = np.asarray(chromosomes)
+        i, j, distance = self._pairs(boards.shape[1])
+        rows_i, rows_j = boards[:, i], boards[:, j]
+        attacks = (rows_i == rows_j) | (np.abs(rows_i - rows_j) == distance)
+        return attacks.sum(axis=1).tolist()
+
+    def tournament_select(self, fitnesses: Sequence[float], num_parents: int, tournament_size: int) -> List[int]:
+        np = self._np
+        fitness_array = np.asarray(fitnesses)
+        size = len(fitness_array)
+        # Each row is one tournament; contenders are distinct within a tournament.
+        if 2 * tournament_size > size:
+            # Large tournaments: take the first contenders of a random ordering of each row.
+            keys = self.rng.random((num_parents, size))
+            contenders = np.argpartition(keys, tournament_size - 1, axis=1)[:, :tournament_size]
+        else:
+            # Draw only tournament_size indices per row, redrawing the (rare) rows with a repeat.
+            contenders = self.rng.integers(0, size, (num_parents, tournament_size))
+            while True:
+                ordered = np.sort(contenders, axis=1)
+                repeated = (ordered[:, 1:] == ordered[:, :-1]).any(axis=1)
+                if not repeated.any():
+                    break
+                contenders[repeated] = self.rng.integers(0, size, (int(repeated.sum()), tournament_size))
+        best = np.argmax(fitness_array[contenders], axis=1)
+        return contenders[np.arange(num_parents), best].tolist()
+
+    def roulette_select(self, fitnesses: Sequence[float], num_parents: int) -> List[int]:
+        np = self._np
+        fitness_array = np.asarray(fitnesses, dtype=float)
+        total = fitness_array.sum()
+        probs = fitness_array / total if total > 0 else None
+        return self.rng.choice(len(fitness_array), size=num_parents, p=probs).tolist()
+
+    def uniform_crossover(self, genes1: Sequence[int], genes2: Sequence[int],
+                          mixing_ratio: float) -> Tuple[List[int], List[int]]:
+        np = self._np
+        a, b = np.asarray(genes1), np.asarray(genes2)
+        mask = self.rng.random(len(a)) < mixing_ratio
+        return np.where(mask, a, b).tolist(), np.where(mask, b, a).tolist()
+
+    def two_point_crossover(self, genes1: Sequence[int], genes2: Sequence[int]) -> Tuple[List[int], List[int]]:
+        point1, point2 = sorted(self.rng.choice(range(1, len(genes1)), 2, replace=False).tolist())
+        child1 = list(genes1[:point1]) + list(genes2[point1:point2]) + list(genes1[point2:])
+        child2 = list(genes2[:point1]) + list(genes1[point1:point2]) + list(genes2[point2:])
+        return child1, child2
+
+    # The in-place variants reuse the vectorized kernels, so they still allocate
+    # temporaries; only the pure Python backend is allocation-free.
+    def uniform_crossover_into(self, genes1: Sequence[int], genes2: Sequence[int],
+                               out1: List[int], out2: List[int], mixing_ratio: float):
+        out1[:], out2[:] = self.uniform_crossover(genes1, genes2, mixing_ratio)
+
+    def two_point_crossover_into(self, genes1: Sequence[int], genes2: Sequence[int],
+                                 out1: List[int], out2: List[int]):
+        out1[:], out2[:] = self.two_point_crossover(genes1, genes2)
+
+    def swap_positions(self, size: int) -> Tuple[int, int]:
+        idx1, idx2 = self.rng.choice(size, 2, replace=False).tolist()
+        return idx1, idx2
+
+    def reset_gene(self, size: int) -> Tuple[int, int]:
+        idx, value = self.rng.integers(0, size, 2).tolist()
+        return idx, value
+
+
+_numba_attacking_pairs = None
+
+
+def _compile_numba_kernels():
+    """Compiles the Numba kernels on first use (compilation takes ~1s)."""
+    global _numba_attacking_pairs
+    if _numba_attacking_pairs is not None:
+        return _numba_attacking_pairs
+    import numpy as np
+    from numba import njit
+
+    @njit(cache=True)
+    def attacking_pairs(boards):
+        num_boards, n = boards.shape
+        result = np.zeros(num_boards, dtype=np.int64)
+        for b in range(num_boards):
+            count = 0
+            for i in range(n):
+                for j in range(i + 1, n):
+                    diff = boards[b, i] - boards[b, j]
+                    if diff == 0 or abs(diff) == j - i:
+                        count += 1
+            result[b] = count
+        return result
+
+    _numba_attacking_pairs = attacking_pairs
+    return attacking_pairs
+
+
+class NumbaBackend(NumpyBackend):
+    """
+    JIT-compiled fitness kernel on top of the NumPy backend. Selection,
+    crossover and mutation are already vectorized or O(1) per call, so they
+    are inherited from NumpyBackend.
+    """
+    name = "numba"
+
+    def __init__(self, seed: Optional[int] = None):
+        super().__init__(seed)
+        self._kernel = _compile_numba_kernels()
+
+    @staticmethod
+    def is_available() -> bool:
+        try:
+            import numba  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def attacking_pairs(self, chromosomes: Sequence[Sequence[int]]) -> List[int]:
+        if len(chromosomes) == 0:
+            return []
+        return self._kernel(self._np.asarray(chromosomes, dtype=self._np.int64)).tolist()
+
+
+BACKENDS: Dict[str, type] = {
+    "python": ComputeBackend,
+    "numpy": NumpyBackend,
+    "numba": NumbaBackend,
+}
+
+# Backend tried next when the requested one is not installed.
+FALLBACKS: Dict[str, str] = {
+    "numba": "numpy",
+    "numpy": "python",
+}
+
+PYTHON_BACKEND = ComputeBackend()
+
+
+class UsesBackend:
+    """
+    Mixin for strategies whose inner loops are kernels of a ComputeBackend.
+
+    `backend` defaults to the pure Python kernels. An engine (or thread
+    worker) never changes a strategy it is given: it keeps the copy returned
+    by `bind`, so one strategy object can be shared by engines with
+    different backends.
+    """
+    backend: ComputeBackend = PYTHON_BACKEND
+
+    def bind(self, backend: ComputeBackend):
+        """Returns a shallow copy of this strategy that uses `backend`."""
+        bound = copy.copy(self)
+        bound.backend = backend
+        return bound
+
+
+def get_backend(name: str = "python", seed: Optional[int] = None) -> ComputeBackend:
+    """
+    Returns an instance of the named backend, falling back to the next
+    available one (numba -> numpy -> python) if it is not installed.
+    "auto" selects the fastest available backend.
+    """
+    if name == "auto":
+        name = "numba"
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown backend '{name}'. Expected one of {sorted(BACKENDS)} or 'auto'.")
+    requested = name
+    while not BACKENDS[name].is_available():
+        name = FALLBACKS[name]
+    if name != requested:
+        warnings.warn(f"Backend '{requested}' is not available, falling back to '{name}'.")
+    if name == "python" and seed is None:
+        return PYTHON_BACKEND
+    return BACKENDS[name](seed)
@@ -1,6 +1,7 @@
 import random
-from typing import List, Optional
-from tqdm import tqdm
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 
 from core.population import Population
 from core.individual import Individual
@@ -9,7 +10,13 @@ from ga.strategies.selection import SelectionStrategy
 from ga.strategies.crossover import CrossoverStrategy
 from ga.strategies.mutation import MutationStrategy
 from ga.strategies.elitism import ElitismStrategy
+from ga.strategies.initialization import InitializationStrategy
+from ga.strategies.replacement import ReplacementStrategy, GenerationalReplacement
+from ga.backends import get_backend
+from ga.parallel import OffspringWorker, free_threading_available
 from utils.logger import Logger
+from utils.diversity import diversity_metrics
+from utils.metrics import RunMetrics
 
 
 class GeneticAlgorithm:
@@ -17,6 +24,24 @@ class GeneticAlgorithm:
     The main Genetic Algorithm engine.
     It is configured with various strategies (selection, crossover, etc.)
     to solve an optimization problem.
+
+    The numeric kernels behind fitness, selection, crossover and mutation come
+    from a compute backend ("python", "numpy", "numba" or "auto"), which falls
+    back to the next available implementation if the requested one is not
+    installed.
+
+    With num_threads > 1 on a free-threaded CPython build, crossover, mutation
+    and evaluation of the offspring are split across a thread pool, each
+    thread using its own RNG. On a regular (GIL) build the engine runs serially.
+
+    With double_buffered=True (the default for the serial loop) the engine keeps
+    two preallocated populations: offspring are written into the slots of the
+    next-generation buffer via CrossoverStrategy.crossover_into and the buffers
+    are swapped, so no Individual or chromosome is allocated per generation.
+
+    A replacement strategy decides which offspring enter the next generation
+    (all of them by default); UniqueReplacement and DeterministicCrowding use
+    a hash index of the genomes to keep duplicates from flooding the population.
     """
 
     def __init__(self,
@@ -24,79 +49,268 @@ class GeneticAlgorithm:
                  selection_strategy: SelectionStrategy,
                  crossover_strategy: CrossoverStrategy,
                  mutation_strategy: MutationStrategy,
-                 elitism_strategy: ElitismStrategy):
-        self.fitness_calculator = NQueensFitness(n_queens)
-        self.selection_strategy = selection_strategy
-        self.crossover_strategy = crossover_strategy
-        self.mutation_strategy = mutation_strategy
+                 elitism_strategy: ElitismStrategy,
+                 backend: str = "python",
+                 num_threads: int = 1,
+                 initialization_strategy: Optional[InitializationStrategy] = None,
+                 double_buffered: bool = True,
+                 replacement_strategy: Optional[ReplacementStrategy] = None):
+        self.backend = get_backend(backend)
+        self.fitness_calculator = NQueensFitness(n_queens, self.backend)
+        # Copies bound to this engine's backend; the caller's strategies are left unchanged.
+        self.selection_strategy = selection_strategy.bind(self.backend)
+        self.crossover_strategy = crossover_strategy.bind(self.backend)
+        self.mutation_strategy = mutation_strategy.bind(self.backend)
         self.elitism_strategy = elitism_strategy
+        self.initialization_strategy = initialization_strategy
+        self.replacement_strategy = (replacement_strategy or GenerationalReplacement()).bind(self.backend)
+        self.double_buffered = double_buffered
         self.n_queens = n_queens
+        # Threads only run in parallel without the GIL; otherwise they just add overhead.
+        self.num_threads = max(1, num_threads) if free_threading_available() else 1
+        # Private RNG for diversity sampling, so logging diversity never
+        # consumes the global stream that drives selection and variation.
+        self.diversity_rng = random.Random(0)
+        # Number of fitness evaluations performed by the last run.
+        self.evaluations = 0
+        # Seconds spent building the initial population of the last run.
+        self.initialization_time = 0.0
+        # Generation in which the last run found a solution (None if it did not).
+        self.solution_generation: Optional[int] = None
+        # Offspring produced by the last run, and how many duplicated a genome
+        # already in their generation (only for strategies that count them).
+        self.offspring_produced = 0
+        self.duplicate_offspring = 0
+        # Operator applications of the last run: parents selected, crossovers and mutations.
+        self.operator_counts: Dict[str, int] = dict.fromkeys(("selection", "crossover", "mutation"), 0)
+        # Fitness evaluations performed up to the generation that found a solution.
+        self.evaluations_to_solution: Optional[int] = None
+
+    @property
+    def duplicate_rate(self) -> Optional[float]:
+        """
+        Fraction of the offspring of the last run that were duplicates when
+        produced, or None if the replacement strategy did not count them.
+        """
+        return self.duplicate_offspring / self.offspring_produced if self.offspring_produced else None
+
+    def _initialize_population(self, population_size: int) -> Population:
+        """Builds the initial population with the configured strategy and times it."""
+        start = time.perf_counter()
+        population = Population.generate_initial_population(
+            population_size, self.n_queens, self.initialization_strategy
+        )
+        self.initialization_time = time.perf_counter() - start
+        return population
+
+    def _evaluate(self, individuals: List[Individual]):
+        """Evaluates the given individuals in one batch and counts the evaluations."""
+        self.fitness_calculator.calculate_batch(individuals)
+        self.evaluations += len(individuals)
 
     def run(self,
             population_size: int,
             num_generations: int,
             mutation_rate: float,
-            logger: Optional[Logger] = None) -> Individual:
+            logger: Optional[Logger] = None,
+            diversity_interval: int = 0,
+            metrics: Optional[RunMetrics] = None,
+            time_limit: Optional[float] = None) -> Individual:
+        """
+        Runs the generational loop and returns the best individual found.
+
+        Args:
+            diversity_interval (int): If > 0, population diversity metrics are
+                                      computed and logged every `diversity_interval`
+                                      generations. 0 disables them.
+            metrics (RunMetrics): Optional live metrics handle, updated once per
+                                  generation with throughput, best fitness and
+                                  the time spent in each phase.
+            time_limit (float): Optional budget in seconds; the run stops after
+                                the first generation that exceeds it.
+        """
 
         # 1. Initialization
-        population = Population.generate_initial_population(population_size, self.n_queens)
-        best_solution_so_far = None
+        run_start = time.perf_counter()
+        population = self._initialize_population(population_size)
+        # The best individual is copied into its own storage, since buffer slots are reused.
+        best_solution_so_far = Individual([0] * self.n_queens)
+        self.evaluations = 0
+        self.solution_generation = None
+        self.offspring_produced = 0
+        self.duplicate_offspring = 0
+        self.operator_counts = dict.fromkeys(self.operator_counts, 0)
+        self.evaluations_to_solution = None
+
+        thread_pool = None
+        workers: List[OffspringWorker] = []
+        if self.num_threads > 1:
+            thread_pool = ThreadPoolExecutor(max_workers=self.num_threads)
+            workers = [
+                OffspringWorker(self.backend.spawn(random.getrandbits(32)), self.crossover_strategy,
+                                self.mutation_strategy, self.n_queens)
+                for _ in range(self.num_threads)
+            ]
+
+        next_population = None
+        spare_child = None
+        if self.double_buffered and not thread_pool:
+            next_population = Population([Individual([0] * self.n_queens) for _ in range(population_size)])
+            # Receives the extra child produced when the number of offspring is odd.
+            spare_child = Individual([0] * self.n_queens)
+
+        if metrics:
+            metrics.start(self.fitness_calculator.max_fitness)
+        phase_seconds = {}
+        reported_evaluations = 0
+
+        try:
+            # Main generational loop
+            for gen in range(num_generations):
+                # 2. Fitness Evaluation (only individuals whose genes changed since
+                # their last evaluation, e.g. elites carried over are skipped)
+                phase_start = time.perf_counter()
+                self._evaluate([individual for individual in population.individuals if individual.dirty])
+                phase_seconds["evaluation"] = time.perf_counter() - phase_start
+
+                # Get stats for logging
+                best_in_gen = population.get_best_individual()
+                if best_in_gen.fitness > best_solution_so_far.fitness:
+                    best_solution_so_far.copy_from(best_in_gen)
+
+                if metrics:
+                    metrics.observe_generation(
+                        best_solution_so_far.fitness, self.evaluations - reported_evaluations, phase_seconds
+                    )
+                    reported_evaluations = self.evaluations
+                    phase_seconds = {}
 
-        # Main generational loop
-        for gen in range(num_generations):
-            # 2. Fitness Evaluation
-            for individual in population.individuals:
-                self.fitness_calculator.calculate(individual)
+                # Log generation data
+                if logger:
+                    avg_fitness = sum(ind.fitness for ind in population.individuals) / population_size
+                    worst_fitness = min(ind.fitness for ind in population.individuals)
+                    diversity = None
+                    if diversity_interval > 0 and gen % diversity_interval == 0:
+                        diversity = diversity_metrics(population, rng=self.diversity_rng)
+                    logger.log_generation(
+                        gen, best_in_gen.fitness, avg_fitness, worst_fitness, diversity
+                    )
 
-            # Get stats for logging
-            best_in_gen = population.get_best_individual()
-            if best_solution_so_far is None or best_in_gen.fitness > best_solution_so_far.fitness:
-                best_solution_so_far = best_in_gen
+                # 3. Check for termination condition (solution found)
+                if best_solution_so_far.fitness == self.fitness_calculator.max_fitness:
+                    # print(f"\nSolution found in generation {gen}!")
+                    self.solution_generation = gen
+                    self.evaluations_to_solution = self.evaluations
+                    break
+                if time_limit is not None and time.perf_counter() - run_start > time_limit:
+                    break
+                if gen == num_generations - 1:
+                    break  # Offspring of the last generation would never be evaluated
 
-            # Log generation data
-            if logger:
-                avg_fitness = sum(ind.fitness for ind in population.individuals) / population_size
-                worst_fitness = min(ind.fitness for ind in population.individuals)
-                logger.log_generation(
-                    gen, best_in_gen.fitness, avg_fitness, worst_fitness
-                )
+                # 4. Create the next generation
+                phase_start = time.perf_counter()
 
-            # 3. Check for termination condition (solution found)
-            if best_solution_so_far.fitness == self.fitness_calculator.max_fitness:
-                # print(f"\nSolution found in generation {gen}!")
-                break
+                # 4a. Elitism
+                elites = self.elitism_strategy.select_elites(population)
 
-            # 4. Create the next generation
-            new_population_individuals: List[Individual] = []
+                # 4b. Crossover and Mutation
+                num_kept = population_size - len(elites)
+                num_offspring = num_kept
 
-            # 4a. Elitism
-            elites = self.elitism_strategy.select_elites(population)
-            new_population_individuals.extend(elites)
+                # Ensure an even number of parents are selected for crossover
+                if num_offspring % 2 != 0:
+                    num_offspring += 1  # We will generate one extra and discard later if needed
 
-            # 4b. Crossover and Mutation
-            num_offspring = population_size - len(elites)
+                parents = self.replacement_strategy.select_parents(population, num_offspring, self.selection_strategy)
+                self.operator_counts["selection"] += len(parents)
+                self.operator_counts["crossover"] += num_offspring // 2
+                phase_seconds["selection"] = time.perf_counter() - phase_start
 
-            # Ensure an even number of parents are selected for crossover
-            if num_offspring % 2 != 0:
-                num_offspring += 1  # We will generate one extra and discard later if needed
+                phase_start = time.perf_counter()
+                if next_population is not None:
+                    # Write elites and offspring into the slots of the other buffer, then swap.
+                    slots = next_population.individuals
+                    for slot, elite in zip(slots, elites):
+                        slot.copy_from(elite)
+                    slot_index = len(elites)
+                    offspring = slots[slot_index:]
+                    for i in range(0, num_offspring, 2):
+                        child1 = slots[slot_index]
+                        child2 = slots[slot_index + 1] if slot_index + 1 < population_size else spare_child
+                        slot_index += 2
 
-            parents = self.selection_strategy.select(population, num_offspring)
+                        self.crossover_strategy.crossover_into(parents[i], parents[i + 1], child1, child2)
 
-            for i in range(0, num_offspring, 2):
-                parent1 = parents[i]
-                parent2 = parents[i + 1]
+                        if random.random() < mutation_rate:
+                            self.mutation_strategy.mutate(child1)
+                            self.operator_counts["mutation"] += 1
+                        if random.random() < mutation_rate:
+                            self.mutation_strategy.mutate(child2)
+                            self.operator_counts["mutation"] += 1
+                else:
+                    offspring: List[Individual] = []
+                    if thread_pool:
+                        offspring = self._produce_offspring_threaded(
+                            thread_pool, workers, parents, mutation_rate, num_kept,
+                            evaluate=not self.replacement_strategy.perturbs_unevaluated
+                        )
+                    else:
+                        for i in range(0, num_offspring, 2):
+                            parent1 = parents[i]
+                            parent2 = parents[i + 1]
 
-                child1, child2 = self.crossover_strategy.crossover(parent1, parent2)
+                            child1, child2 = self.crossover_strategy.crossover(parent1, parent2)
 
-                if random.random() < mutation_rate:
-                    self.mutation_strategy.mutate(child1)
-                if random.random() < mutation_rate:
-                    self.mutation_strategy.mutate(child2)
+                            if random.random() < mutation_rate:
+                                self.mutation_strategy.mutate(child1)
+                                self.operator_counts["mutation"] += 1
+                            if random.random() < mutation_rate:
+                                self.mutation_strategy.mutate(child2)
+                                self.operator_counts["mutation"] += 1
 
-                new_population_individuals.append(child1)
-                new_population_individuals.append(child2)
+                            offspring.append(child1)
+                            offspring.append(child2)
+                        offspring = offspring[:num_kept]  # Drops the odd child of the last pair
+                phase_seconds["variation"] = time.perf_counter() - phase_start
 
-            # Ensure population size is maintained
-            population = Population(new_population_individuals[:population_size])
+                # 4c. Replacement (offspring are edited in place). On every path
+                # `offspring` holds exactly the num_kept children that enter the
+                # next generation; the odd child of the last pair is already gone.
+                phase_start = time.perf_counter()
+                duplicates = self.replacement_strategy.replace(parents, offspring, elites, self._evaluate)
+                if duplicates is not None:
+                    self.duplicate_offspring += duplicates
+                    self.offspring_produced += len(offspring)
+                if next_population is not None:
+                    population, next_population = next_population, population
+                else:
+                    population = Population(list(elites) + offspring)
+                phase_seconds["replacement"] = time.perf_counter() - phase_start
+        finally:
+            # Also runs if the loop raises, so worker threads and the metrics
+            # handles (e.g. an AllocationProbe's tracing and GC hook) are released.
+            if thread_pool:
+                thread_pool.shutdown()
+                self.operator_counts["mutation"] += sum(worker.mutations for worker in workers)
+            if metrics:
+                metrics.finish()
+        return best_solution_so_far
 
-        return best_solution_so_far
\ No newline at end of file
+    def _produce_offspring_threaded(self, thread_pool: ThreadPoolExecutor, workers: List[OffspringWorker],
+                                    parents: List[Individual], mutation_rate: float,
+                                    num_offspring: int, evaluate: bool = True) -> List[Individual]:
+        """
+        Splits the parent pairs into one contiguous chunk per worker and
+        produces them in parallel. Only the first `num_offspring` children are
+        kept, so the odd child of the last pair is neither evaluated nor counted.
+        With `evaluate=False` the children are left dirty for the main loop.
+        """
+        pairs = [(parents[i], parents[i + 1]) for i in range(0, len(parents), 2)]
+        chunk_size = -(-len(pairs) // len(workers))
+        jobs = [(workers[k], pairs[i:i + chunk_size], min(2 * chunk_size, num_offspring - 2 * i))
+                for k, i in enumerate(range(0, len(pairs), chunk_size))]
+        results = thread_pool.map(lambda job: job[0].produce(job[1], mutation_rate, job[2], evaluate), jobs)
+        offspring = [child for chunk in results for child in chunk]
+        if evaluate:
+            self.evaluations += len(offspring)
+        return offspring
\ No newline at end of file
@@ -0,0 +1,65 @@
+import sys
+from typing import List, Optional, Sequence, Tuple
+
+from core.individual import Individual
+from ga.backends import ComputeBackend
+from problem.n_queens import NQueensFitness
+
+
+def free_threading_available() -> bool:
+    """True when running on a free-threaded CPython build with the GIL disabled (3.13t+)."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+class OffspringWorker:
+    """
+    Produces, mutates and evaluates offspring for one thread.
+
+    Each worker owns a backend with its own RNG and private copies of the
+    crossover and mutation strategies bound to it, so threads never share
+    random state or mutable strategy objects.
+    """
+    def __init__(self, backend: ComputeBackend, crossover_strategy, mutation_strategy, n_queens: int):
+        self.backend = backend
+        self.crossover_strategy = crossover_strategy.bind(backend)
+        self.mutation_strategy = mutation_strategy.bind(backend)
+        self.fitness_calculator = NQueensFitness(n_queens, backend)
+        # Mutations applied by this worker, collected by the engine's operator counts.
+        self.mutations = 0
+
+    def produce(self, parent_pairs: Sequence[Tuple[Individual, Individual]], mutation_rate: float,
+                num_children: Optional[int] = None, evaluate: bool = True) -> List[Individual]:
+        """
+        Returns the children of the given parent pairs, evaluated unless
+        `evaluate` is False. With `num_children`, only the first
+        `num_children` are kept (e.g. to drop the odd child of the last pair).
+        """
+        rng = self.backend.rng
+        offspring = []
+        for parent1, parent2 in parent_pairs:
+            child1, child2 = self.crossover_strategy.crossover(parent1, parent2)
+            if rng.random() < mutation_rate:
+                self.mutation_strategy.mutate(child1)
+                self.mutations += 1
+            if rng.random() < mutation_rate:
+                self.mutation_strategy.mutate(child2)
+                self.mutations += 1
+            offspring.append(child1)
+            offspring.append(child2)
+        offspring = offspring[:num_children]
+        if evaluate:
+            self.fitness_calculator.calculate_batch(offspring)
+        return offspring
+
+
+def produce_offspring_chunk(args) -> List[Tuple[List[int], float]]:
+    """
+    Process-pool counterpart of OffspringWorker.produce, used as a baseline in
+    benchmarks. Parents and children cross the process boundary as pickled
+    chromosome lists.
+    """
+    worker_args, parent_chromosomes, mutation_rate = args
+    worker = OffspringWorker(*worker_args)
+    pairs = [(Individual(list(a)), Individual(list(b))) for a, b in parent_chromosomes]
+    return [(child.chromosome, child.fitness) for child in worker.produce(pairs, mutation_rate)]
@@ -0,0 +1,172 @@
+import bisect
+import random
+import time
+from typing import List, Optional, Tuple
+
+from core.population import Population
+from core.individual import Individual
+from ga.genetic_algorithm import GeneticAlgorithm
+from utils.logger import Logger
+from utils.diversity import diversity_metrics
+from utils.metrics import RunMetrics
+
+
+class SteadyStateGeneticAlgorithm(GeneticAlgorithm):
+    """
+    Steady-state variant of the GA engine.
+
+    Instead of rebuilding the whole population every generation, each step
+    breeds a few offspring and writes them in place over the worst individuals
+    (or over the losers of small tournaments). A sorted (fitness, slot) list
+    is updated incrementally: best/worst queries are O(1) and each replacement
+    is a binary search plus an O(P) list insertion/deletion (a memmove, cheap
+    at the population sizes used here).
+
+    The elitism strategy is not used: the current best individual is never
+    chosen for replacement, which gives the same guarantee. Neither is the
+    replacement strategy; the `replacement` policy below takes its place.
+    """
+
+    REPLACEMENT_POLICIES = ("worst", "tournament")
+
+    def __init__(self, *args,
+                 offspring_per_step: int = 2,
+                 replacement: str = "worst",
+                 replacement_tournament_size: int = 3,
+                 **kwargs):
+        super().__init__(*args, **kwargs)
+        if offspring_per_step < 1:
+            raise ValueError("offspring_per_step must be at least 1.")
+        if replacement not in self.REPLACEMENT_POLICIES:
+            raise ValueError(f"Unknown replacement policy '{replacement}'. Expected one of {self.REPLACEMENT_POLICIES}.")
+        if replacement_tournament_size < 1:
+            raise ValueError("replacement_tournament_size must be at least 1.")
+        self.offspring_per_step = offspring_per_step
+        self.replacement = replacement
+        self.replacement_tournament_size = replacement_tournament_size
+
+    def _choose_victim(self, population: Population, index: List[Tuple[float, int]]) -> int:
+        """Returns the slot whose individual is replaced by the next offspring."""
+        if self.replacement == "worst":
+            return index[0][1]
+        best_slot = index[-1][1]
+        candidates = [slot for slot in random.sample(range(len(population)), self.replacement_tournament_size)
+                      if slot != best_slot] or [index[0][1]]
+        return min(candidates, key=lambda slot: population.individuals[slot].fitness)
+
+    def run(self,
+            population_size: int,
+            num_generations: int,
+            mutation_rate: float,
+            logger: Optional[Logger] = None,
+            diversity_interval: int = 0,
+            metrics: Optional[RunMetrics] = None,
+            time_limit: Optional[float] = None) -> Individual:
+        """
+        Runs the steady-state loop and returns the best individual found.
+
+        `num_generations` is converted into an equivalent evaluation budget:
+        one "generation" is `population_size` offspring, i.e.
+        population_size / offspring_per_step steps. Logging happens once per
+        generation-equivalent so logs and metrics stay comparable with the
+        generational GA. `time_limit` (seconds) is checked once per
+        generation-equivalent.
+        """
+        if self.replacement == "tournament" and self.replacement_tournament_size > population_size:
+            raise ValueError(
+                f"replacement_tournament_size ({self.replacement_tournament_size}) cannot exceed "
+                f"population_size ({population_size})."
+            )
+        run_start = time.perf_counter()
+        population = self._initialize_population(population_size)
+        individuals = population.individuals
+        self.evaluations = 0
+        self.solution_generation = None
+        self.operator_counts = dict.fromkeys(self.operator_counts, 0)
+        self.evaluations_to_solution = None
+        self._evaluate(individuals)
+
+        # Sorted (fitness, slot) pairs: index[0] is the worst, index[-1] the best.
+        index = sorted((ind.fitness, slot) for slot, ind in enumerate(individuals))
+        fitness_sum = sum(ind.fitness for ind in individuals)
+        max_fitness = self.fitness_calculator.max_fitness
+
+        steps_per_generation = max(1, population_size // self.offspring_per_step)
+        num_parents = self.offspring_per_step + self.offspring_per_step % 2
+
+        if metrics:
+            metrics.start(max_fitness)
+        phase_seconds = {"selection": 0.0, "variation": 0.0, "evaluation": 0.0, "replacement": 0.0}
+        reported_evaluations = 0
+
+        try:
+            for step in range(num_generations * steps_per_generation):
+                if step % steps_per_generation == 0:
+                    gen = step // steps_per_generation
+                    if metrics:
+                        metrics.observe_generation(index[-1][0], self.evaluations - reported_evaluations, phase_seconds)
+                        reported_evaluations = self.evaluations
+                        phase_seconds = dict.fromkeys(phase_seconds, 0.0)
+                    if logger:
+                        diversity = None
+                        if diversity_interval > 0 and gen % diversity_interval == 0:
+                            diversity = diversity_metrics(population, rng=self.diversity_rng)
+                        logger.log_generation(
+                            gen, index[-1][0], fitness_sum / population_size, index[0][0], diversity
+                        )
+
+                if index[-1][0] == max_fitness:
+                    self.solution_generation = step // steps_per_generation
+                    self.evaluations_to_solution = self.evaluations
+                    break
+                if (time_limit is not None and step % steps_per_generation == 0
+                        and time.perf_counter() - run_start > time_limit):
+                    break
+
+                # Breed a few offspring from the current population.
+                phase_start = time.perf_counter()
+                parents = self.selection_strategy.select(population, num_parents)
+                self.operator_counts["selection"] += num_parents
+                self.operator_counts["crossover"] += num_parents // 2
+                phase_end = time.perf_counter()
+                phase_seconds["selection"] += phase_end - phase_start
+
+                phase_start = phase_end
+                offspring: List[Individual] = []
+                for i in range(0, num_parents, 2):
+                    offspring.extend(self.crossover_strategy.crossover(parents[i], parents[i + 1]))
+                offspring = offspring[:self.offspring_per_step]
+                for child in offspring:
+                    if random.random() < mutation_rate:
+                        self.mutation_strategy.mutate(child)
+                        self.operator_counts["mutation"] += 1
+                phase_end = time.perf_counter()
+                phase_seconds["variation"] += phase_end - phase_start
+
+                phase_start = phase_end
+                self._evaluate([child for child in offspring if child.dirty])
+                phase_end = time.perf_counter()
+                phase_seconds["evaluation"] += phase_end - phase_start
+
+                # Replace in place, keeping the fitness index sorted.
+                phase_start = phase_end
+                for child in offspring:
+                    slot = self._choose_victim(population, index)
+                    victim = individuals[slot]
+                    if child.fitness < victim.fitness:
+                        continue
+                    del index[bisect.bisect_left(index, (victim.fitness, slot))]
+                    bisect.insort(index, (child.fitness, slot))
+                    fitness_sum += child.fitness - victim.fitness
+                    individuals[slot] = child
+                phase_seconds["replacement"] += time.perf_counter() - phase_start
+            else:
+                # The budget ran out; a solution bred on the last step is recorded here.
+                if index[-1][0] == max_fitness:
+                    self.solution_generation = num_generations
+                    self.evaluations_to_solution = self.evaluations
+        finally:
+            # Also runs if the loop raises, so the metrics handles are released.
+            if metrics:
+                metrics.finish(index[-1][0])
+        return individuals[index[-1][1]]
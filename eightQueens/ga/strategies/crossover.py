@@ -1,16 +1,26 @@
-import random
 from abc import ABC, abstractmethod
 from typing import Tuple
 from core.individual import Individual
+from ga.backends import UsesBackend
 
 
-class CrossoverStrategy(ABC):
+class CrossoverStrategy(UsesBackend, ABC):
     """Abstract base class for crossover strategies."""
 
     @abstractmethod
     def crossover(self, parent1: Individual, parent2: Individual) -> Tuple[Individual, Individual]:
         pass
 
+    def crossover_into(self, parent1: Individual, parent2: Individual, child1: Individual, child2: Individual):
+        """
+        Writes the offspring of two parents into preallocated individuals.
+        Subclasses override this to avoid allocating; the default delegates to
+        `crossover` and copies the result into the given slots.
+        """
+        offspring1, offspring2 = self.crossover(parent1, parent2)
+        child1.copy_from(offspring1)
+        child2.copy_from(offspring2)
+
 
 class UniformCrossover(CrossoverStrategy):
     """
@@ -27,25 +37,22 @@ class UniformCrossover(CrossoverStrategy):
         self.name = "Uniform"
 
     def crossover(self, parent1: Individual, parent2: Individual) -> Tuple[Individual, Individual]:
-        size = len(parent1)
-        child1_chromosome = []
-        child2_chromosome = []
-
-        # Itera por cada gene do cromossomo.
-        for i in range(size):
-            # "Joga a moeda".
-            if random.random() < self.mixing_ratio:
-                # Se o resultado for menor que a taxa, o filho1 herda do pai1 e o filho2 do pai2.
-                child1_chromosome.append(parent1.chromosome[i])
-                child2_chromosome.append(parent2.chromosome[i])
-            else:
-                # Caso contrário, eles herdam dos pais opostos.
-                child1_chromosome.append(parent2.chromosome[i])
-                child2_chromosome.append(parent1.chromosome[i])
+        # Para cada gene, "joga a moeda": se o resultado for menor que a taxa, o filho1
+        # herda do pai1 e o filho2 do pai2; caso contrário, herdam dos pais opostos.
+        child1_chromosome, child2_chromosome = self.backend.uniform_crossover(
+            parent1.chromosome, parent2.chromosome, self.mixing_ratio
+        )
 
         # Retorna os dois novos indivíduos criados.
         return Individual(child1_chromosome), Individual(child2_chromosome)
 
+    def crossover_into(self, parent1: Individual, parent2: Individual, child1: Individual, child2: Individual):
+        # Mesma "moeda" por gene, mas escrevendo direto nos filhos pré-alocados.
+        self.backend.uniform_crossover_into(
+            parent1.chromosome, parent2.chromosome, child1.writable_genes(), child2.writable_genes(),
+            self.mixing_ratio
+        )
+
 
 class TwoPointCrossover(CrossoverStrategy):
     """
@@ -58,15 +65,20 @@ class TwoPointCrossover(CrossoverStrategy):
     def crossover(self, parent1: Individual, parent2: Individual) -> Tuple[Individual, Individual]:
         size = len(parent1)
         if size < 3:
-            return parent1, parent2
+            # No cut points fit: the children are copies of the parents.
+            return Individual(list(parent1.chromosome)), Individual(list(parent2.chromosome))
 
-        point1, point2 = sorted(random.sample(range(1, size), 2))
+        child1_chromosome, child2_chromosome = self.backend.two_point_crossover(
+            parent1.chromosome, parent2.chromosome
+        )
 
-        child1_chromosome = (parent1.chromosome[:point1] +
-                             parent2.chromosome[point1:point2] +
-                             parent1.chromosome[point2:])
-        child2_chromosome = (parent2.chromosome[:point1] +
-                             parent1.chromosome[point1:point2] +
-                             parent2.chromosome[point2:])
+        return Individual(child1_chromosome), Individual(child2_chromosome)
 
-        return Individual(child1_chromosome), Individual(child2_chromosome)
\ No newline at end of file
+    def crossover_into(self, parent1: Individual, parent2: Individual, child1: Individual, child2: Individual):
+        if len(parent1) < 3:
+            child1.copy_from(parent1)
+            child2.copy_from(parent2)
+            return
+        self.backend.two_point_crossover_into(
+            parent1.chromosome, parent2.chromosome, child1.writable_genes(), child2.writable_genes()
+        )
\ No newline at end of file
@@ -0,0 +1,164 @@
+import random
+from abc import ABC, abstractmethod
+from typing import List, Sequence
+
+from problem.symmetry import board_symmetries
+
+
+class InitializationStrategy(ABC):
+    """Abstract base class for strategies that build the chromosomes of the initial population."""
+
+    @abstractmethod
+    def create_chromosomes(self, population_size: int, n_queens: int) -> List[List[int]]:
+        pass
+
+
+class RandomInitialization(InitializationStrategy):
+    """
+    Fills every gene with a uniformly random row. Queens may share rows,
+    so the search starts with many horizontal and diagonal clashes.
+    """
+
+    def __init__(self):
+        self.name = "Random"
+
+    def create_chromosomes(self, population_size: int, n_queens: int) -> List[List[int]]:
+        return [[random.randint(0, n_queens - 1) for _ in range(n_queens)] for _ in range(population_size)]
+
+
+class PermutationInitialization(InitializationStrategy):
+    """
+    Creates random permutations of the rows, which removes every horizontal
+    clash up front at the same O(N) cost per individual.
+    """
+
+    def __init__(self):
+        self.name = "Permutation"
+
+    def create_chromosomes(self, population_size: int, n_queens: int) -> List[List[int]]:
+        chromosomes = []
+        for _ in range(population_size):
+            chromosome = list(range(n_queens))
+            random.shuffle(chromosome)
+            chromosomes.append(chromosome)
+        return chromosomes
+
+
+class GreedyMinConflictInitialization(InitializationStrategy):
+    """
+    Builds each board column by column (in a random column order), placing
+    the queen on a row with the fewest conflicts with the queens already
+    placed; ties are broken at random. Occupancy counters for rows and both
+    diagonals make this O(N^2) per individual.
+    """
+
+    def __init__(self):
+        self.name = "GreedyMinConflict"
+
+    def create_chromosomes(self, population_size: int, n_queens: int) -> List[List[int]]:
+        return [self._build(n_queens) for _ in range(population_size)]
+
+    @staticmethod
+    def _build(n: int, prefix: Sequence[int] = ()) -> List[int]:
+        """Builds one board; the first len(prefix) columns are fixed to `prefix`."""
+        rows = [0] * n
+        diagonals = [0] * (2 * n - 1)       # indexed by row + col
+        anti_diagonals = [0] * (2 * n - 1)  # indexed by row - col + n - 1
+        chromosome = [0] * n
+        for col, row in enumerate(prefix):
+            chromosome[col] = row
+            rows[row] += 1
+            diagonals[row + col] += 1
+            anti_diagonals[row - col + n - 1] += 1
+        columns = list(range(len(prefix), n))
+        random.shuffle(columns)
+        for col in columns:
+            best_rows = []
+            best_conflicts = None
+            for row in range(n):
+                conflicts = rows[row] + diagonals[row + col] + anti_diagonals[row - col + n - 1]
+                if best_conflicts is None or conflicts < best_conflicts:
+                    best_conflicts = conflicts
+                    best_rows = [row]
+                elif conflicts == best_conflicts:
+                    best_rows.append(row)
+            row = random.choice(best_rows)
+            chromosome[col] = row
+            rows[row] += 1
+            diagonals[row + col] += 1
+            anti_diagonals[row - col + n - 1] += 1
+        return chromosome
+
+
+class MixedInitialization(InitializationStrategy):
+    """
+    Builds a fraction of the population with the greedy min-conflict
+    heuristic and the rest as random permutations, trading some diversity
+    for a better starting point.
+    """
+
+    def __init__(self, greedy_fraction: float = 0.5):
+        if not 0.0 <= greedy_fraction <= 1.0:
+            raise ValueError("greedy_fraction must be between 0.0 and 1.0.")
+        self.greedy_fraction = greedy_fraction
+        self.greedy = GreedyMinConflictInitialization()
+        self.permutation = PermutationInitialization()
+        self.name = f"Mixed(greedy={greedy_fraction*100:.0f}%)"
+
+    def create_chromosomes(self, population_size: int, n_queens: int) -> List[List[int]]:
+        num_greedy = round(population_size * self.greedy_fraction)
+        return (self.greedy.create_chromosomes(num_greedy, n_queens) +
+                self.permutation.create_chromosomes(population_size - num_greedy, n_queens))
+
+
+class WarmStartInitialization(InitializationStrategy):
+    """
+    Seeds a fraction of the population from boards found by earlier runs and
+    builds the rest as random permutations, which keeps the population diverse.
+
+    Boards for the same N are used as they are. If there are none, or
+    `same_n` is False, the boards of the largest smaller N are extended to the
+    target size: the small board keeps its columns and rows, and the new
+    columns are filled with the greedy min-conflict heuristic. Experiments
+    that measure the benefit of warm starts set `same_n=False`, since a
+    stored solution for the same N would end the run at generation 0. Each seed is a random symmetry (rotation or
+    reflection) of its source board, so repeated seeds stay distinct.
+
+    The boards come from `sources`, objects with `boards(n)` and
+    `board_sizes()` (SolutionArchive, EliteArchive) attached by the caller,
+    like the compute backend of the other strategies. Without sources the
+    whole population is built from random permutations.
+    """
+    sources: Sequence = ()
+
+    def __init__(self, fraction: float = 0.2, same_n: bool = True):
+        if not 0.0 <= fraction <= 1.0:
+            raise ValueError("fraction must be between 0.0 and 1.0.")
+        self.fraction = fraction
+        self.same_n = same_n
+        self.permutation = PermutationInitialization()
+        self.name = f"WarmStart({fraction*100:.0f}%)" if same_n else f"WarmStart({fraction*100:.0f}%, smaller N)"
+
+    def seed_boards(self, n_queens: int) -> List[List[int]]:
+        """Returns the stored boards for N, or those of the closest smaller N extended to N."""
+        if self.same_n:
+            boards = [board for source in self.sources for board in source.boards(n_queens)]
+            if boards:
+                return boards
+        smaller = [size for source in self.sources for size in source.board_sizes() if size < n_queens]
+        if not smaller:
+            return []
+        closest = max(smaller)
+        return [GreedyMinConflictInitialization._build(n_queens, board)
+                for source in self.sources for board in source.boards(closest)]
+
+    def create_chromosomes(self, population_size: int, n_queens: int) -> List[List[int]]:
+        boards = self.seed_boards(n_queens) if self.fraction > 0 else []
+        num_seeds = round(population_size * self.fraction) if boards else 0
+        seeds = []
+        for i in range(num_seeds):
+            board = boards[i % len(boards)]
+            if len(set(board)) == n_queens:  # Symmetries are only defined for permutations
+                board = list(random.choice(board_symmetries(board)))
+            seeds.append(list(board))
+        return seeds + self.permutation.create_chromosomes(population_size - num_seeds, n_queens)
@@ -1,9 +1,9 @@
-import random
 from abc import ABC, abstractmethod
 from core.individual import Individual
+from ga.backends import UsesBackend
 
 
-class MutationStrategy(ABC):
+class MutationStrategy(UsesBackend, ABC):
     """Abstract base class for mutation strategies."""
 
     @abstractmethod
@@ -25,10 +25,8 @@ class SwapMutation(MutationStrategy):
         if size < 2:
             return
 
-        idx1, idx2 = random.sample(range(size), 2)
-
-        chromosome = individual.chromosome
-        chromosome[idx1], chromosome[idx2] = chromosome[idx2], chromosome[idx1]
+        idx1, idx2 = self.backend.swap_positions(size)
+        individual.swap_genes(idx1, idx2)
 
 
 class RandomResettingMutation(MutationStrategy):
@@ -42,6 +40,5 @@ class RandomResettingMutation(MutationStrategy):
 
     def mutate(self, individual: Individual):
         size = len(individual.chromosome)
-        gene_to_mutate = random.randint(0, size - 1)
-        new_value = random.randint(0, size - 1)
-        individual.chromosome[gene_to_mutate] = new_value
\ No newline at end of file
+        gene_to_mutate, new_value = self.backend.reset_gene(size)
+        individual.set_gene(gene_to_mutate, new_value)
\ No newline at end of file
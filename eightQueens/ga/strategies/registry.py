@@ -0,0 +1,74 @@
+from typing import Any, Dict, Union
+
+from ga.strategies.selection import TournamentSelection, RouletteWheelSelection
+from ga.strategies.crossover import UniformCrossover, TwoPointCrossover
+from ga.strategies.mutation import SwapMutation, RandomResettingMutation
+from ga.strategies.elitism import BestNElitism, PercentageElitism
+from ga.strategies.initialization import (
+    RandomInitialization, PermutationInitialization, GreedyMinConflictInitialization, MixedInitialization,
+    WarmStartInitialization
+)
+from ga.strategies.replacement import GenerationalReplacement, UniqueReplacement, DeterministicCrowding
+
+# Maps each strategy kind to the classes available for it, keyed by the name
+# used in experiment specs. Keyword arguments in a spec are passed to the class.
+STRATEGY_REGISTRY: Dict[str, Dict[str, type]] = {
+    "selection": {
+        "Tournament": TournamentSelection,
+        "RouletteWheel": RouletteWheelSelection,
+    },
+    "crossover": {
+        "Uniform": UniformCrossover,
+        "TwoPoint": TwoPointCrossover,
+    },
+    "mutation": {
+        "Swap": SwapMutation,
+        "RandomReset": RandomResettingMutation,
+    },
+    "elitism": {
+        "BestN": BestNElitism,
+        "Percentage": PercentageElitism,
+    },
+    "initialization": {
+        "Random": RandomInitialization,
+        "Permutation": PermutationInitialization,
+        "GreedyMinConflict": GreedyMinConflictInitialization,
+        "Mixed": MixedInitialization,
+        "WarmStart": WarmStartInitialization,
+    },
+    "replacement": {
+        "Generational": GenerationalReplacement,
+        "Unique": UniqueReplacement,
+        "DeterministicCrowding": DeterministicCrowding,
+    },
+}
+
+
+def register_strategy(kind: str, name: str, strategy_cls: type):
+    """Makes a strategy class available to experiment specs under `name`."""
+    if kind not in STRATEGY_REGISTRY:
+        raise ValueError(f"Unknown strategy kind '{kind}'. Expected one of {sorted(STRATEGY_REGISTRY)}.")
+    STRATEGY_REGISTRY[kind][name] = strategy_cls
+
+
+def build_strategy(kind: str, spec: Union[str, Dict[str, Any]]):
+    """
+    Instantiates a strategy from its spec.
+
+    Args:
+        kind (str): One of "selection", "crossover", "mutation", "elitism", "initialization"
+                    or "replacement".
+        spec (str | dict): Either the registered name, e.g. "Swap", or a dict
+                           with a "type" key and the constructor arguments,
+                           e.g. {"type": "Tournament", "tournament_size": 3}.
+    """
+    if kind not in STRATEGY_REGISTRY:
+        raise ValueError(f"Unknown strategy kind '{kind}'. Expected one of {sorted(STRATEGY_REGISTRY)}.")
+    if isinstance(spec, str):
+        spec = {"type": spec}
+    kwargs = dict(spec)
+    name = kwargs.pop("type", None)
+    strategies = STRATEGY_REGISTRY[kind]
+    if name not in strategies:
+        raise ValueError(f"Unknown {kind} strategy '{name}'. Expected one of {sorted(strategies)}.")
+    return strategies[name](**kwargs)
@@ -0,0 +1,178 @@
+from abc import ABC, abstractmethod
+from typing import Callable, List, Optional, Set, Tuple
+
+from core.individual import Individual
+from core.population import Population
+from ga.backends import UsesBackend
+
+
+class ReplacementStrategy(UsesBackend, ABC):
+    """
+    Abstract base class for strategies that decide which offspring enter the
+    next generation of the generational engine.
+
+    The offspring are edited in place (they may be population slots), after
+    crossover and mutation: offspring[i] and offspring[i + 1] are the children
+    of parents[i] and parents[i + 1]. The offspring are exactly the children
+    that enter the next generation, so when their number is odd the last
+    child's sibling has already been dropped. Strategies that look for duplicates keep
+    a hash index (a set of chromosome tuples) of the genomes already in the
+    next generation, so a duplicate is detected in O(1) per child.
+    """
+    # Random swaps tried on a duplicate before its genes are shuffled.
+    max_attempts = 3
+    # True if replace() may change offspring without reading their fitness;
+    # the engine then does not evaluate them before replacement, since a
+    # changed child would have to be evaluated again.
+    perturbs_unevaluated = False
+
+    def select_parents(self, population: Population, num_parents: int, selection_strategy) -> List[Individual]:
+        """Chooses the parents of the offspring; by default the selection strategy does."""
+        return selection_strategy.select(population, num_parents)
+
+    @abstractmethod
+    def replace(self, parents: List[Individual], offspring: List[Individual], elites: List[Individual],
+                evaluate: Callable[[List[Individual]], None]) -> Optional[int]:
+        """
+        Finalizes the offspring of one generation.
+
+        Args:
+            evaluate: Evaluates a list of individuals (and counts the evaluations).
+
+        Returns:
+            int: The number of offspring that duplicated a genome already in
+                 the next generation when they were produced, or None if the
+                 strategy does not look for duplicates.
+        """
+        pass
+
+    @staticmethod
+    def _index(individuals: List[Individual]) -> Set[Tuple[int, ...]]:
+        return {tuple(individual.chromosome) for individual in individuals}
+
+    def _perturb(self, individual: Individual, index: Set[Tuple[int, ...]]) -> Tuple[int, ...]:
+        """Changes a duplicate until its genome is new (or attempts run out); returns the genome."""
+        size = len(individual)
+        if size >= 2:
+            for _ in range(self.max_attempts):
+                individual.swap_genes(*self.backend.swap_positions(size))
+                genome = tuple(individual.chromosome)
+                if genome not in index:
+                    return genome
+        self.backend.rng.shuffle(individual.writable_genes())
+        return tuple(individual.chromosome)
+
+
+class GenerationalReplacement(ReplacementStrategy):
+    """
+    Keeps every offspring (the classic generational GA). Duplicates are only
+    counted with `count_duplicates=True`; by default nothing is done, so the
+    generation loop does not build a genome index it does not need.
+    """
+
+    def __init__(self, count_duplicates: bool = False):
+        self.count_duplicates = count_duplicates
+        self.name = "Generational"
+
+    def replace(self, parents, offspring, elites, evaluate) -> Optional[int]:
+        if not self.count_duplicates:
+            return None
+        index = self._index(elites)
+        duplicates = 0
+        for child in offspring:
+            genome = tuple(child.chromosome)
+            if genome in index:
+                duplicates += 1
+            else:
+                index.add(genome)
+        return duplicates
+
+
+class UniqueReplacement(ReplacementStrategy):
+    """
+    Rejects offspring whose genome is already in the next generation: the
+    duplicate is perturbed with random swaps (up to `max_attempts`) and, if it
+    is still a duplicate, its genes are shuffled. The next generation thus has
+    no repeated genomes unless the gene pool is too small to avoid them.
+    """
+
+    perturbs_unevaluated = True
+
+    def __init__(self, max_attempts: int = 3):
+        self.max_attempts = max_attempts
+        self.name = "Unique"
+
+    def replace(self, parents, offspring, elites, evaluate) -> int:
+        index = self._index(elites)
+        duplicates = 0
+        for child in offspring:
+            genome = tuple(child.chromosome)
+            if genome in index:
+                duplicates += 1
+                genome = self._perturb(child, index)
+            index.add(genome)
+        return duplicates
+
+
+class DeterministicCrowding(ReplacementStrategy):
+    """
+    Deterministic crowding: parents are paired at random, without selection
+    pressure, and each child competes with the closer (by Hamming distance)
+    of its two parents. It only enters the next generation if it is at least
+    as fit; otherwise that parent survives. Because a child can only displace
+    a similar individual, niches around different boards survive longer.
+
+    A winning child whose genome is already in the next generation is
+    rejected, keeping its parent; a surviving parent that is itself a
+    duplicate is perturbed like in UniqueReplacement. Either case counts the
+    slot as one duplicate.
+
+    The offspring are evaluated here, so the engine does not evaluate them
+    again (perturbed survivors are evaluated with the next generation).
+    """
+
+    def __init__(self, max_attempts: int = 3):
+        self.max_attempts = max_attempts
+        self.name = "DeterministicCrowding"
+
+    def select_parents(self, population, num_parents, selection_strategy) -> List[Individual]:
+        """Pairs the individuals of a shuffled population (reshuffled if more parents are needed)."""
+        parents: List[Individual] = []
+        while len(parents) < num_parents:
+            shuffled = list(population.individuals)
+            self.backend.rng.shuffle(shuffled)
+            parents.extend(shuffled[:num_parents - len(parents)])
+        return parents
+
+    def replace(self, parents, offspring, elites, evaluate) -> int:
+        evaluate([child for child in offspring if child.dirty])
+        index = self._index(elites)
+        duplicates = 0
+        for i in range(0, len(offspring), 2):
+            parent1, parent2 = parents[i], parents[i + 1]
+            if i + 1 < len(offspring):
+                child1, child2 = offspring[i], offspring[i + 1]
+                if (_hamming(parent1, child1) + _hamming(parent2, child2) >
+                        _hamming(parent1, child2) + _hamming(parent2, child1)):
+                    parent1, parent2 = parent2, parent1
+                contests = ((parent1, child1), (parent2, child2))
+            else:
+                # A child without its sibling competes with its closer parent.
+                child = offspring[i]
+                contests = ((min(parent1, parent2, key=lambda parent: _hamming(parent, child)), child),)
+            for parent, child in contests:
+                genome = tuple(child.chromosome)
+                is_duplicate = genome in index
+                if child.fitness < parent.fitness or is_duplicate:
+                    child.copy_from(parent)
+                    genome = tuple(child.chromosome)
+                    if genome in index:
+                        is_duplicate = True
+                        genome = self._perturb(child, index)
+                duplicates += is_duplicate
+                index.add(genome)
+        return duplicates
+
+
+def _hamming(a: Individual, b: Individual) -> int:
+    return sum(1 for x, y in zip(a.chromosome, b.chromosome) if x != y)
@@ -1,11 +1,12 @@
-import random
 from abc import ABC, abstractmethod
 from typing import List
 from core.population import Population
 from core.individual import Individual
+from ga.backends import UsesBackend
 
-class SelectionStrategy(ABC):
+class SelectionStrategy(UsesBackend, ABC):
     """Abstract base class for selection strategies."""
+
     @abstractmethod
     def select(self, population: Population, num_parents: int) -> List[Individual]:
         pass
@@ -20,12 +21,10 @@ class TournamentSelection(SelectionStrategy):
         self.name = f"Tournament(k={tournament_size})"
 
     def select(self, population: Population, num_parents: int) -> List[Individual]:
-        selected_parents = []
-        for _ in range(num_parents):
-            tournament_contenders = random.sample(population.individuals, self.tournament_size)
-            winner = max(tournament_contenders, key=lambda ind: ind.fitness)
-            selected_parents.append(winner)
-        return selected_parents
+        individuals = population.individuals
+        fitnesses = [ind.fitness for ind in individuals]
+        winners = self.backend.tournament_select(fitnesses, num_parents, self.tournament_size)
+        return [individuals[i] for i in winners]
 
 class RouletteWheelSelection(SelectionStrategy):
     """
@@ -35,15 +34,8 @@ class RouletteWheelSelection(SelectionStrategy):
         self.name = "RouletteWheel"
 
     def select(self, population: Population, num_parents: int) -> List[Individual]:
-        total_fitness = sum(ind.fitness for ind in population.individuals)
-        if total_fitness == 0:
-            # If all fitnesses are 0, select randomly
-            return random.choices(population.individuals, k=num_parents)
-
-        selection_probs = [ind.fitness / total_fitness for ind in population.individuals]
-        selected_parents = random.choices(
-            population.individuals,
-            weights=selection_probs,
-            k=num_parents
-        )
-        return selected_parents
\ No newline at end of file
+        # If all fitnesses are 0, the backend selects uniformly at random.
+        individuals = population.individuals
+        fitnesses = [ind.fitness for ind in individuals]
+        selected = self.backend.roulette_select(fitnesses, num_parents)
+        return [individuals[i] for i in selected]
\ No newline at end of file
@@ -1,17 +1,13 @@
 import os
 import time
-import pandas as pd
-from tqdm import tqdm
 
 from ga.genetic_algorithm import GeneticAlgorithm
+from ga.steady_state import SteadyStateGeneticAlgorithm
+from ga.strategies.initialization import WarmStartInitialization
 from utils.logger import Logger
-
-# Import Strategies
-from ga.strategies.selection import TournamentSelection, RouletteWheelSelection
-# A importação foi alterada aqui:
-from ga.strategies.crossover import UniformCrossover, TwoPointCrossover
-from ga.strategies.mutation import SwapMutation, RandomResettingMutation
-from ga.strategies.elitism import BestNElitism, PercentageElitism
+from utils.solution_archive import SolutionArchive, EliteArchive
+from utils.metrics import MetricsRegistry, MetricsServer, MetricsGroup
+from utils.memory_profile import AllocationProbe
 
 # --- BASE CONFIGURATION ---
 BASE_PARAMS = {
@@ -23,209 +19,187 @@ BASE_PARAMS = {
     "elitism_percentage": 0.1,  # 10%
     "tournament_k": 3,
     "num_runs": 20,
+    "diversity_interval": 10,  # log diversity metrics every 10 generations (0 disables)
+    "backend": "python",  # compute backend: "python", "numpy", "numba" or "auto"
+    "num_threads": 1,  # offspring threads; only used on free-threaded Python builds
+    "engine": "generational",  # or "steady_state"
+    "offspring_per_step": 2,  # steady-state only
+    "replacement": "worst",  # steady-state only: "worst" or "tournament"
+    "profile_memory": False,  # add tracemalloc/GC/RSS columns to the summary (slows runs down)
 }
 
 RESULTS_DIR = "results"
 os.makedirs(RESULTS_DIR, exist_ok=True)
 
+# Distinct solutions (up to board symmetry) found across all runs and executions.
+SOLUTION_ARCHIVE = SolutionArchive(os.path.join(RESULTS_DIR, "solution_archive.json"))
+# Best board of every past run, per N; together with the solutions it seeds warm-started runs.
+ELITE_ARCHIVE = EliteArchive(os.path.join(RESULTS_DIR, "elite_archive.json"))
 
-def experiment_part_1_selection():
-    """Compares two selection strategies."""
-    print("\n--- Running Experiment Part 1: Selection Strategies ---")
-    folder = "part_1_selection"
-    os.makedirs(os.path.join(RESULTS_DIR, folder), exist_ok=True)
-
-    configs = [
-        {
-            "name": "Tournament",
-            "folder": folder,
-            "params": BASE_PARAMS,
-            "selection": TournamentSelection(BASE_PARAMS["tournament_k"]),
-            # Alterado aqui para usar UniformCrossover como baseline
-            "crossover": UniformCrossover(),
-            "mutation": SwapMutation(),
-            "elitism": BestNElitism(BASE_PARAMS["elitism_n"]),
-        },
-        {
-            "name": "RouletteWheel",
-            "folder": folder,
-            "params": BASE_PARAMS,
-            "selection": RouletteWheelSelection(),
-            # Alterado aqui
-            "crossover": UniformCrossover(),
-            "mutation": SwapMutation(),
-            "elitism": BestNElitism(BASE_PARAMS["elitism_n"]),
-        }
-    ]
+# Live metrics, only collected once enable_metrics() has started the endpoint.
+METRICS = None
+
+
+def enable_metrics(port: int = 9100, host: str = "127.0.0.1") -> MetricsServer:
+    """Starts the local Prometheus metrics endpoint; every following run reports to it."""
+    global METRICS
+    METRICS = MetricsRegistry()
+    server = MetricsServer(METRICS, host, port).start()
+    print(f"Serving live metrics at {server.url}")
+    return server
 
-    summary_results = []
-    for config in configs:
-        print(f"Testing configuration: {config['name']}")
-        for i in tqdm(range(BASE_PARAMS["num_runs"]), desc=f"Runs for {config['name']}"):
-            result = run_single_experiment(config, i)
-            summary_results.append(result)
 
+def progress(iterable, desc: str):
+    """Wraps an iterable in a tqdm progress bar. tqdm is imported lazily to keep startup fast."""
+    from tqdm import tqdm
+    return tqdm(iterable, desc=desc)
+
+
+def save_summary(summary_results: list, folder: str, filename: str = "summary.csv"):
+    """Saves the per-run summary rows of an experiment to its summary.csv (or another CSV)."""
+    import pandas as pd
     df = pd.DataFrame(summary_results)
-    df.to_csv(os.path.join(RESULTS_DIR, folder, "summary.csv"), index=False)
-    print(f"Part 1 Summary saved to {os.path.join(RESULTS_DIR, folder, 'summary.csv')}")
+    df.to_csv(os.path.join(RESULTS_DIR, folder, filename), index=False)
+
+
+EXPERIMENTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "experiments")
+
+
+def run_experiment_spec(name: str) -> list:
+    """Runs experiments/<name>.json, the single definition shared with cli.py."""
+    from cli import load_spec, run_spec
+    return run_spec(load_spec(os.path.join(EXPERIMENTS_DIR, f"{name}.json")))
+
+
+def experiment_part_1_selection():
+    """Compares two selection strategies."""
+    print("\n--- Running Experiment Part 1: Selection Strategies ---")
+    run_experiment_spec("part_1_selection")
 
 
 def experiment_part_2_crossover():
     """Compares two crossover strategies."""
     print("\n--- Running Experiment Part 2: Crossover Strategies ---")
-    folder = "part_2_crossover"
-    os.makedirs(os.path.join(RESULTS_DIR, folder), exist_ok=True)
-
-    configs = [
-        {
-            # A primeira configuração agora testa o UniformCrossover
-            "name": "Uniform",
-            "folder": folder,
-            "params": BASE_PARAMS,
-            "selection": TournamentSelection(BASE_PARAMS["tournament_k"]),
-            "crossover": UniformCrossover(),
-            "mutation": SwapMutation(),
-            "elitism": BestNElitism(BASE_PARAMS["elitism_n"]),
-        },
-        {
-            "name": "TwoPoint",
-            "folder": folder,
-            "params": BASE_PARAMS,
-            "selection": TournamentSelection(BASE_PARAMS["tournament_k"]),
-            "crossover": TwoPointCrossover(),
-            "mutation": SwapMutation(),
-            "elitism": BestNElitism(BASE_PARAMS["elitism_n"]),
-        }
-    ]
-
-    summary_results = []
-    for config in configs:
-        print(f"Testing configuration: {config['name']}")
-        for i in tqdm(range(BASE_PARAMS["num_runs"]), desc=f"Runs for {config['name']}"):
-            result = run_single_experiment(config, i)
-            summary_results.append(result)
-
-    df = pd.DataFrame(summary_results)
-    df.to_csv(os.path.join(RESULTS_DIR, folder, "summary.csv"), index=False)
-    print(f"Part 2 Summary saved to {os.path.join(RESULTS_DIR, folder, 'summary.csv')}")
+    run_experiment_spec("part_2_crossover")
 
 
 def experiment_part_3_elitism():
     """Compares two elitism strategies."""
     print("\n--- Running Experiment Part 3: Elitism Strategies ---")
-    folder = "part_3_elitism"
-    os.makedirs(os.path.join(RESULTS_DIR, folder), exist_ok=True)
-
-    configs = [
-        {
-            "name": "BestN",
-            "folder": folder,
-            "params": BASE_PARAMS,
-            "selection": TournamentSelection(BASE_PARAMS["tournament_k"]),
-            # Alterado aqui
-            "crossover": UniformCrossover(),
-            "mutation": SwapMutation(),
-            "elitism": BestNElitism(BASE_PARAMS["elitism_n"]),
-        },
-        {
-            "name": "Percentage",
-            "folder": folder,
-            "params": BASE_PARAMS,
-            "selection": TournamentSelection(BASE_PARAMS["tournament_k"]),
-            # Alterado aqui
-            "crossover": UniformCrossover(),
-            "mutation": SwapMutation(),
-            "elitism": PercentageElitism(BASE_PARAMS["elitism_percentage"]),
-        }
-    ]
-
-    summary_results = []
-    for config in configs:
-        print(f"Testing configuration: {config['name']}")
-        for i in tqdm(range(BASE_PARAMS["num_runs"]), desc=f"Runs for {config['name']}"):
-            result = run_single_experiment(config, i)
-            summary_results.append(result)
-
-    df = pd.DataFrame(summary_results)
-    df.to_csv(os.path.join(RESULTS_DIR, folder, "summary.csv"), index=False)
-    print(f"Part 3 Summary saved to {os.path.join(RESULTS_DIR, folder, 'summary.csv')}")
+    run_experiment_spec("part_3_elitism")
 
 
 def experiment_part_4_mutation():
     """Compares two mutation strategies."""
     print("\n--- Running Experiment Part 4: Mutation Strategies ---")
-    folder = "part_4_mutation"
-    os.makedirs(os.path.join(RESULTS_DIR, folder), exist_ok=True)
-
-    configs = [
-        {
-            "name": "Swap",
-            "folder": folder,
-            "params": BASE_PARAMS,
-            "selection": TournamentSelection(BASE_PARAMS["tournament_k"]),
-            # Alterado aqui
-            "crossover": UniformCrossover(),
-            "mutation": SwapMutation(),
-            "elitism": BestNElitism(BASE_PARAMS["elitism_n"]),
-        },
-        {
-            "name": "RandomReset",
-            "folder": folder,
-            "params": BASE_PARAMS,
-            "selection": TournamentSelection(BASE_PARAMS["tournament_k"]),
-            # Alterado aqui
-            "crossover": UniformCrossover(),
-            "mutation": RandomResettingMutation(),
-            "elitism": BestNElitism(BASE_PARAMS["elitism_n"]),
-        }
-    ]
-
-    summary_results = []
-    for config in configs:
-        print(f"Testing configuration: {config['name']}")
-        for i in tqdm(range(BASE_PARAMS["num_runs"]), desc=f"Runs for {config['name']}"):
-            result = run_single_experiment(config, i)
-            summary_results.append(result)
-
-    df = pd.DataFrame(summary_results)
-    df.to_csv(os.path.join(RESULTS_DIR, folder, "summary.csv"), index=False)
-    print(f"Part 4 Summary saved to {os.path.join(RESULTS_DIR, folder, 'summary.csv')}")
+    run_experiment_spec("part_4_mutation")
 
 
 def run_single_experiment(config: dict, run_id: int, show_progress=False):
     """Helper to run one instance of a GA configuration."""
+    result, best_solution = execute_run(config, run_id, show_progress)
+    archive_run(result, best_solution.chromosome, config)
+    return result
+
+
+def archive_run(result: dict, chromosome, config: dict):
+    """
+    Stores a run's best board in the elite archive and, if it is a solution,
+    in the solution archive, setting the row's new_distinct_solution flag.
+    """
+    if ELITE_ARCHIVE.add(chromosome, result["best_fitness"]):
+        ELITE_ARCHIVE.save()
+    if result["solution_found"]:
+        result["new_distinct_solution"] = SOLUTION_ARCHIVE.add(
+            chromosome, f"{config['folder']}/{config['name']}", result["run_id"]
+        )
+        SOLUTION_ARCHIVE.save()
+
+
+def execute_run(config: dict, run_id: int, show_progress=False, time_limit=None):
+    """
+    Runs one instance of a GA configuration without writing the solution or
+    elite archives, so it can be used from worker processes. The run stops
+    early if it exceeds `time_limit` seconds.
+
+    Returns:
+        (dict, Individual): The summary row and the best individual found.
+    """
     logger = Logger(
         os.path.join(
             RESULTS_DIR, config["folder"], f"run_{run_id}_{config['name']}_n{config['params']['n_queens']}.csv"
         )
     ) if not show_progress else None
 
-    ga = GeneticAlgorithm(
-        n_queens=config["params"]["n_queens"],
+    params = config["params"]
+    initialization = config.get("initialization")
+    if isinstance(initialization, WarmStartInitialization):
+        initialization.sources = (ELITE_ARCHIVE, SOLUTION_ARCHIVE)
+    engine_kwargs = {}
+    engine_cls = GeneticAlgorithm
+    if params.get("engine", "generational") == "steady_state":
+        engine_cls = SteadyStateGeneticAlgorithm
+        engine_kwargs = {
+            "offspring_per_step": params.get("offspring_per_step", 2),
+            "replacement": params.get("replacement", "worst"),
+        }
+
+    ga = engine_cls(
+        n_queens=params["n_queens"],
         selection_strategy=config["selection"],
         crossover_strategy=config["crossover"],
         mutation_strategy=config["mutation"],
         elitism_strategy=config["elitism"],
+        backend=params.get("backend", "python"),
+        num_threads=params.get("num_threads", 1),
+        initialization_strategy=initialization,
+        replacement_strategy=config.get("replacement"),
+        **engine_kwargs,
     )
+    metrics = METRICS.run_metrics(
+        folder=config["folder"], config=config["name"], run=run_id, n=params["n_queens"]
+    ) if METRICS else None
+    memory_probe = AllocationProbe() if params.get("profile_memory", False) else None
+    if memory_probe:
+        metrics = MetricsGroup(metrics, memory_probe)
+
     start_time = time.time()
     best_solution = ga.run(
         population_size=config["params"]["population_size"],
         num_generations=config["params"]["num_generations"],
         mutation_rate=config["params"]["mutation_rate"],
         logger=logger,
+        diversity_interval=config["params"].get("diversity_interval", 0),
+        metrics=metrics,
+        time_limit=time_limit,
     )
     end_time = time.time()
 
     if logger:
         logger.save()
 
-    return {
+    result = {
         "run_id": run_id,
         "config_name": config["name"],
+        "n_queens": params["n_queens"],
+        "population_size": params["population_size"],
+        "num_generations": params["num_generations"],
         "best_fitness": best_solution.fitness,
         "execution_time": end_time - start_time,
-        "solution_found": best_solution.fitness == ga.fitness_calculator.max_fitness
+        "initialization_time": ga.initialization_time,
+        "evaluations": ga.evaluations,
+        "solution_generation": ga.solution_generation,
+        "evaluations_to_solution": ga.evaluations_to_solution,
+        "selections": ga.operator_counts["selection"],
+        "crossovers": ga.operator_counts["crossover"],
+        "mutations": ga.operator_counts["mutation"],
+        "duplicate_rate": ga.duplicate_rate,
+        "solution_found": best_solution.fitness == ga.fitness_calculator.max_fitness,
+        "new_distinct_solution": False
     }
+    if memory_probe:
+        result.update(memory_probe.run_summary())
+    return result, best_solution
 
 
 def experiment_part_5_scalability():
@@ -234,78 +208,28 @@ def experiment_part_5_scalability():
     and satisfy the 10+ minute execution time requirement.
     """
     print("\n--- Running Experiment Part 5: Scalability (Problem Size) ---")
-    folder = "part_5_scalability"
-    os.makedirs(os.path.join(RESULTS_DIR, folder), exist_ok=True)
-
-    champion_configs = [
-        {
-            "name": "Champ_TournamentSel",
-            "selection": TournamentSelection(BASE_PARAMS["tournament_k"]),
-            # Alterado aqui
-            "crossover": UniformCrossover(),
-            "mutation": SwapMutation(),
-            "elitism": BestNElitism(BASE_PARAMS["elitism_n"]),
-        },
-        {
-            "name": "Champ_TwoPointCross",
-            "selection": TournamentSelection(BASE_PARAMS["tournament_k"]),
-            "crossover": TwoPointCrossover(),
-            "mutation": SwapMutation(),
-            "elitism": BestNElitism(BASE_PARAMS["elitism_n"]),
-        },
-        {
-            "name": "Champ_RandomResetMut",
-            "selection": TournamentSelection(BASE_PARAMS["tournament_k"]),
-            # Alterado aqui
-            "crossover": UniformCrossover(),
-            "mutation": RandomResettingMutation(),
-            "elitism": BestNElitism(BASE_PARAMS["elitism_n"]),
-        },
-        {
-            "name": "Champ_PercentageElit",
-            "selection": TournamentSelection(BASE_PARAMS["tournament_k"]),
-            # Alterado aqui
-            "crossover": UniformCrossover(),
-            "mutation": SwapMutation(),
-            "elitism": PercentageElitism(BASE_PARAMS["elitism_percentage"]),
-        }
-    ]
-
-    n_values = [10, 15, 20, 25, 30, 35, 40]
-    summary_results = []
-    total_execution_time = 0
-
-    for n in n_values:
-        print(f"\n----- Testing for N = {n} -----")
-        current_params = BASE_PARAMS.copy()
-        current_params["n_queens"] = n
-        current_params["num_generations"] = 1000
-        current_params["population_size"] = 200
-
-        for config_template in champion_configs:
-            config = config_template.copy()
-            config["params"] = current_params
-            config["folder"] = folder
-
-            print(f"Running configuration: {config['name']} for N={n}")
-
-            for i in tqdm(range(2), desc=f"Runs for {config['name']}"):
-                result = run_single_experiment(config, i, show_progress=True)
-                result["n_queens"] = n
-                summary_results.append(result)
-                total_execution_time += result["execution_time"]
-
+    summary_results = run_experiment_spec("part_5_scalability")
+    total_execution_time = sum(result["execution_time"] for result in summary_results)
     print(f"\nTotal execution time for Part 5: {total_execution_time / 60:.2f} minutes.")
-    df = pd.DataFrame(summary_results)
-    df.to_csv(os.path.join(RESULTS_DIR, folder, "summary.csv"), index=False)
-    print(f"Part 5 Summary saved to {os.path.join(RESULTS_DIR, folder, 'summary.csv')}")
 
 
-if __name__ == "__main__":
+def run_all_experiments():
+    """Runs experiment parts 1-5, serving live metrics if NQUEENS_METRICS_PORT is set."""
+    if os.environ.get("NQUEENS_METRICS_PORT"):
+        enable_metrics(int(os.environ["NQUEENS_METRICS_PORT"]))
     experiment_part_1_selection()
     experiment_part_2_crossover()
     experiment_part_3_elitism()
     experiment_part_4_mutation()
     experiment_part_5_scalability()
     print("\nAll experiments complete. Check the 'results' folder.")
+    print(f"Distinct solutions archived per N: {SOLUTION_ARCHIVE.counts_by_n()}")
     print("Now run 'python plotter.py' to generate graphs.")
+
+
+if __name__ == "__main__":
+    # cli.py imports this file as `main`; running the experiments through that
+    # module keeps a single copy of METRICS and the archives instead of a
+    # second one in `__main__`.
+    import main
+    main.run_all_experiments()
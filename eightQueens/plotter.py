@@ -101,6 +101,45 @@ def plot_experiment_summary(exp_folder: str, exp_name: str):
     plt.close()
 
 
+def plot_evaluations_to_solution(exp_folder: str, exp_name: str):
+    """
+    Plota o número de avaliações de fitness até a solução por configuração,
+    uma medida de custo independente do hardware. Experimentos com vários N
+    geram curvas vs. N (escala log); os demais, um boxplot por configuração.
+    Apenas as execuções que encontraram a solução são consideradas.
+    """
+    summary_path = os.path.join(RESULTS_DIR, exp_folder, "summary.csv")
+    if not os.path.exists(summary_path):
+        return
+
+    df = pd.read_csv(summary_path)
+    if 'evaluations_to_solution' not in df.columns:
+        print(f"Aviso: '{exp_name}' não registra avaliações até a solução. Execute o experimento novamente.")
+        return
+    solved = df[df['solution_found']]
+    if solved.empty:
+        print(f"Aviso: Nenhuma execução de '{exp_name}' encontrou a solução. Pulando gráfico de avaliações.")
+        return
+
+    plt.figure(figsize=(12, 7))
+    if 'n_queens' in df.columns and df['n_queens'].nunique() > 1:
+        sns.lineplot(data=solved, x='n_queens', y='evaluations_to_solution', hue='config_name', marker='o', errorbar='sd')
+        plt.yscale('log')
+        plt.xlabel("Número de Rainhas (N)", fontsize=12)
+        plt.legend(title='Configuração')
+    else:
+        sns.boxplot(data=solved, x='config_name', y='evaluations_to_solution', color=".8")
+        sns.swarmplot(data=solved, x='config_name', y='evaluations_to_solution', size=5)
+        plt.xlabel("Configuração", fontsize=12)
+    plt.title(f"Avaliações de Fitness até a Solução: {exp_name}", fontsize=16)
+    plt.ylabel("Avaliações até a Solução", fontsize=12)
+    plt.tight_layout()
+    plot_path = os.path.join(PLOTS_DIR, f"{exp_folder}_evaluations_to_solution.png")
+    plt.savefig(plot_path)
+    print(f"-> Gráfico de avaliações até a solução salvo em: {plot_path}")
+    plt.close()
+
+
 def plot_scalability():
     """
     Plota o tempo de execução vs. tamanho do problema (N) para o experimento de escalabilidade.
@@ -164,6 +203,170 @@ def plot_total_execution_time():
     plt.close()
 
 
+def plot_initialization():
+    """
+    Compara as estratégias de inicialização da população: tempo total até a solução
+    (incluindo a construção da população) e custo da inicialização vs. N.
+    """
+    exp_folder = "initialization"
+    summary_path = os.path.join(RESULTS_DIR, exp_folder, "summary.csv")
+    if not os.path.exists(summary_path):
+        return
+
+    df = pd.read_csv(summary_path)
+
+    fig, axes = plt.subplots(1, 2, figsize=(16, 7))
+    sns.lineplot(data=df, x='n_queens', y='execution_time', hue='config_name', marker='o', errorbar='sd', ax=axes[0])
+    axes[0].set_title("Tempo Total de Execução (inclui inicialização)", fontsize=14)
+    axes[0].set_xlabel("Número de Rainhas (N)", fontsize=12)
+    axes[0].set_ylabel("Tempo Médio (segundos)", fontsize=12)
+
+    sns.lineplot(data=df, x='n_queens', y='initialization_time', hue='config_name', marker='o', errorbar='sd', ax=axes[1])
+    axes[1].set_title("Custo da Inicialização da População", fontsize=14)
+    axes[1].set_xlabel("Número de Rainhas (N)", fontsize=12)
+    axes[1].set_ylabel("Tempo Médio (segundos)", fontsize=12)
+
+    fig.suptitle("Estratégias de Inicialização vs. Tamanho do Problema (N)", fontsize=16)
+    plt.tight_layout()
+    plot_path = os.path.join(PLOTS_DIR, f"{exp_folder}_time_vs_n.png")
+    plt.savefig(plot_path)
+    print(f"-> Gráfico de inicialização salvo em: {plot_path}")
+    plt.close()
+
+
+def plot_exact_baseline():
+    """
+    Plota o tempo até a primeira solução dos resolvedores exatos (construtivo e
+    backtracking) e das variações campeãs do AG vs. N, em escala logarítmica.
+    Apenas as execuções que encontraram a solução são consideradas.
+    """
+    exp_folder = "exact_baseline"
+    summary_path = os.path.join(RESULTS_DIR, exp_folder, "summary.csv")
+    if not os.path.exists(summary_path):
+        return
+
+    df = pd.read_csv(summary_path)
+    solved = df[df['solution_found']]
+
+    plt.figure(figsize=(12, 7))
+    sns.lineplot(data=solved, x='n_queens', y='execution_time', hue='method', marker='o', errorbar=None)
+    plt.yscale('log')
+    plt.title("Tempo até a Primeira Solução: Resolvedores Exatos vs. AG", fontsize=16)
+    plt.xlabel("Número de Rainhas (N)", fontsize=12)
+    plt.ylabel("Tempo Médio (segundos, escala log)", fontsize=12)
+    plt.grid(True)
+    plt.legend(title='Método')
+    plt.tight_layout()
+    plot_path = os.path.join(PLOTS_DIR, f"{exp_folder}_time_vs_n.png")
+    plt.savefig(plot_path)
+    print(f"-> Gráfico de comparação com resolvedores exatos salvo em: {plot_path}")
+    plt.close()
+
+
+def plot_memory_profile(exp_folder: str):
+    """
+    Plota as métricas de memória por execução (pico de alocação rastreada,
+    alocação por geração, coletas do GC e pico de RSS) vs. N. Só gera o gráfico
+    se o experimento foi executado com "profile_memory" habilitado.
+    """
+    summary_path = os.path.join(RESULTS_DIR, exp_folder, "summary.csv")
+    if not os.path.exists(summary_path):
+        return
+
+    df = pd.read_csv(summary_path)
+    if 'peak_traced_kib' not in df.columns or 'n_queens' not in df.columns:
+        return
+
+    panels = [
+        ('peak_traced_kib', "Pico de Alocação Rastreada (KiB)"),
+        ('allocated_kib_per_generation', "Alocação Média por Geração (KiB)"),
+        ('gc_collections', "Coletas do GC por Execução"),
+        ('peak_rss_mib', "Pico de RSS do Processo (MiB)"),
+    ]
+    fig, axes = plt.subplots(2, 2, figsize=(16, 11))
+    for ax, (column, title) in zip(axes.flat, panels):
+        if df[column].notna().any():
+            sns.lineplot(data=df, x='n_queens', y=column, hue='config_name', marker='o', errorbar='sd', ax=ax)
+        ax.set_title(title, fontsize=14)
+        ax.set_xlabel("Número de Rainhas (N)", fontsize=12)
+        ax.set_ylabel(title, fontsize=12)
+
+    fig.suptitle(f"Uso de Memória vs. Tamanho do Problema (N): {exp_folder}", fontsize=16)
+    plt.tight_layout()
+    plot_path = os.path.join(PLOTS_DIR, f"{exp_folder}_memory_vs_n.png")
+    plt.savefig(plot_path)
+    print(f"-> Gráfico de uso de memória salvo em: {plot_path}")
+    plt.close()
+
+
+def plot_warm_start():
+    """
+    Compara execuções com população inicial aleatória e com partida a quente
+    (sementes estendidas de soluções e elites de N menores, sem usar soluções
+    já conhecidas do mesmo N): geração em que a solução foi encontrada e taxa
+    de sucesso vs. N.
+    """
+    exp_folder = "warm_start"
+    summary_path = os.path.join(RESULTS_DIR, exp_folder, "summary.csv")
+    if not os.path.exists(summary_path):
+        return
+
+    df = pd.read_csv(summary_path)
+    solved = df[df['solution_found']]
+
+    fig, axes = plt.subplots(1, 2, figsize=(16, 7))
+    sns.lineplot(data=solved, x='n_queens', y='solution_generation', hue='config_name', marker='o', errorbar='sd', ax=axes[0])
+    axes[0].set_title("Gerações até a Solução (execuções com sucesso)", fontsize=14)
+    axes[0].set_xlabel("Número de Rainhas (N)", fontsize=12)
+    axes[0].set_ylabel("Geração Média da Solução", fontsize=12)
+
+    success_rate = df.groupby(['n_queens', 'config_name'])['solution_found'].mean().reset_index()
+    sns.lineplot(data=success_rate, x='n_queens', y='solution_found', hue='config_name', marker='o', ax=axes[1])
+    axes[1].set_title("Taxa de Sucesso", fontsize=14)
+    axes[1].set_xlabel("Número de Rainhas (N)", fontsize=12)
+    axes[1].set_ylabel("Fração de Execuções com Solução", fontsize=12)
+
+    fig.suptitle("Partida a Quente vs. Inicialização do Zero", fontsize=16)
+    plt.tight_layout()
+    plot_path = os.path.join(PLOTS_DIR, f"{exp_folder}_generations_vs_n.png")
+    plt.savefig(plot_path)
+    print(f"-> Gráfico de partida a quente salvo em: {plot_path}")
+    plt.close()
+
+
+def plot_crowding():
+    """
+    Compara as estratégias de substituição (geracional, sem duplicatas e
+    crowding determinístico): taxa de filhos duplicados e número de avaliações
+    de fitness até a solução vs. N.
+    """
+    exp_folder = "crowding"
+    summary_path = os.path.join(RESULTS_DIR, exp_folder, "summary.csv")
+    if not os.path.exists(summary_path):
+        return
+
+    df = pd.read_csv(summary_path)
+    solved = df[df['solution_found']]
+
+    fig, axes = plt.subplots(1, 2, figsize=(16, 7))
+    sns.lineplot(data=df, x='n_queens', y='duplicate_rate', hue='config_name', marker='o', errorbar='sd', ax=axes[0])
+    axes[0].set_title("Taxa de Filhos Duplicados", fontsize=14)
+    axes[0].set_xlabel("Número de Rainhas (N)", fontsize=12)
+    axes[0].set_ylabel("Fração dos Filhos Gerados", fontsize=12)
+
+    sns.lineplot(data=solved, x='n_queens', y='evaluations', hue='config_name', marker='o', errorbar='sd', ax=axes[1])
+    axes[1].set_title("Avaliações até a Solução (execuções com sucesso)", fontsize=14)
+    axes[1].set_xlabel("Número de Rainhas (N)", fontsize=12)
+    axes[1].set_ylabel("Avaliações de Fitness", fontsize=12)
+
+    fig.suptitle("Estratégias de Substituição vs. Tamanho do Problema (N)", fontsize=16)
+    plt.tight_layout()
+    plot_path = os.path.join(PLOTS_DIR, f"{exp_folder}_duplicates_vs_n.png")
+    plt.savefig(plot_path)
+    print(f"-> Gráfico de substituição salvo em: {plot_path}")
+    plt.close()
+
+
 # --- PONTO DE ENTRADA DO SCRIPT ---
 if __name__ == "__main__":
     print("--- Gerando Gráficos para os Experimentos ---")
@@ -172,25 +375,51 @@ if __name__ == "__main__":
     print("\nAnalisando Experimento 1: Estratégias de Seleção")
     plot_convergence("part_1_selection", "Convergência: Estratégias de Seleção")
     plot_experiment_summary("part_1_selection", "Estratégias de Seleção")
+    plot_evaluations_to_solution("part_1_selection", "Estratégias de Seleção")
 
     # Parte 2 - Crossover
     print("\nAnalisando Experimento 2: Estratégias de Crossover")
     plot_convergence("part_2_crossover", "Convergência: Estratégias de Crossover")
     plot_experiment_summary("part_2_crossover", "Estratégias de Crossover")
+    plot_evaluations_to_solution("part_2_crossover", "Estratégias de Crossover")
 
     # Parte 3 - Elitismo
     print("\nAnalisando Experimento 3: Estratégias de Elitismo")
     plot_convergence("part_3_elitism", "Convergência: Estratégias de Elitismo")
     plot_experiment_summary("part_3_elitism", "Estratégias de Elitismo")
+    plot_evaluations_to_solution("part_3_elitism", "Estratégias de Elitismo")
 
     # Parte 4 - Mutação
     print("\nAnalisando Experimento 4: Estratégias de Mutação")
     plot_convergence("part_4_mutation", "Convergência: Estratégias de Mutação")
     plot_experiment_summary("part_4_mutation", "Estratégias de Mutação")
+    plot_evaluations_to_solution("part_4_mutation", "Estratégias de Mutação")
 
     # Parte 5 - Escalabilidade
     print("\nAnalisando Experimento 5: Escalabilidade")
     plot_scalability()
     plot_total_execution_time()
+    plot_evaluations_to_solution("part_5_scalability", "Escalabilidade")
+    plot_memory_profile("part_5_scalability")
+
+    # Inicialização da população (experiments/initialization.json)
+    print("\nAnalisando Experimento: Estratégias de Inicialização")
+    plot_initialization()
+
+    # Comparação com resolvedores exatos (python cli.py baseline)
+    print("\nAnalisando Comparação: Resolvedores Exatos vs. AG")
+    plot_exact_baseline()
+
+    # Perfil de memória (experiments/memory_profile.json)
+    print("\nAnalisando Experimento: Perfil de Memória")
+    plot_memory_profile("memory_profile")
+
+    # Partida a quente (experiments/warm_start.json)
+    print("\nAnalisando Experimento: Partida a Quente")
+    plot_warm_start()
+
+    # Substituição / crowding (experiments/crowding.json)
+    print("\nAnalisando Experimento: Estratégias de Substituição")
+    plot_crowding()
 
     print("\nTodos os gráficos foram gerados. Verifique a pasta 'plots'.")
\ No newline at end of file
@@ -0,0 +1,70 @@
+import time
+from typing import List, Optional
+
+
+class SearchLimitReached(Exception):
+    """Raised when the backtracking solver exceeds its node or time budget."""
+
+
+def backtracking_solution(n: int, max_nodes: Optional[int] = None,
+                          time_limit: Optional[float] = None) -> Optional[List[int]]:
+    """
+    Finds the first N-Queens solution by depth-first backtracking over
+    columns, tracking occupied rows and diagonals as bitmasks so each
+    placement is O(1).
+
+    Args:
+        n (int): Board size.
+        max_nodes (int): Optional budget of placements to try.
+        time_limit (float): Optional budget in seconds (checked every 10000 placements).
+                            SearchLimitReached is raised when either budget is exceeded.
+
+    Returns:
+        The chromosome (row of the queen in each column), or None if no solution exists.
+    """
+    full = (1 << n) - 1
+    chromosome = [0] * n
+    nodes = 0
+    deadline = time.perf_counter() + time_limit if time_limit is not None else None
+
+    def place(col: int, rows: int, diagonals: int, anti_diagonals: int) -> bool:
+        nonlocal nodes
+        if col == n:
+            return True
+        # Bits set in `free` are rows not attacked by any queen already placed.
+        free = full & ~(rows | diagonals | anti_diagonals)
+        while free:
+            bit = free & -free
+            free ^= bit
+            nodes += 1
+            if max_nodes is not None and nodes > max_nodes:
+                raise SearchLimitReached(f"No solution found within {max_nodes} nodes for N={n}.")
+            if deadline is not None and nodes % 10000 == 0 and time.perf_counter() > deadline:
+                raise SearchLimitReached(f"No solution found within {time_limit}s for N={n}.")
+            chromosome[col] = bit.bit_length() - 1
+            if place(col + 1, rows | bit, ((diagonals | bit) << 1) & full, (anti_diagonals | bit) >> 1):
+                return True
+        return False
+
+    return chromosome if place(0, 0, 0, 0) else None
+
+
+def constructive_solution(n: int) -> List[int]:
+    """
+    Returns a solution for any N >= 4 in O(N) using the classic explicit
+    construction: even rows first, then odd rows, with small fix-ups when
+    N mod 6 is 2 or 3.
+    """
+    if n < 4:
+        raise ValueError("The constructive solution is only defined for N >= 4.")
+    # 1-indexed rows, as in the usual statement of the construction.
+    evens = list(range(2, n + 1, 2))
+    odds = list(range(1, n + 1, 2))
+    if n % 6 == 2:
+        # Swap 1 and 3, and move 5 to the end of the odd rows.
+        odds = [3, 1] + [r for r in odds if r not in (1, 3, 5)] + [5]
+    elif n % 6 == 3:
+        # Move 2 to the end of the even rows, and 1, 3 to the end of the odd rows.
+        evens = [r for r in evens if r != 2] + [2]
+        odds = [r for r in odds if r not in (1, 3)] + [1, 3]
+    return [row - 1 for row in evens + odds]
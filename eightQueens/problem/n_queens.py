@@ -1,4 +1,7 @@
+from typing import List, Optional
+
 from core.individual import Individual
+from ga.backends import ComputeBackend, PYTHON_BACKEND
 
 
 class NQueensFitness:
@@ -8,30 +11,30 @@ class NQueensFitness:
     A perfect solution has zero attacking pairs.
     """
 
-    def __init__(self, n: int):
+    def __init__(self, n: int, backend: Optional[ComputeBackend] = None):
         if n < 4:
             raise ValueError("The N-Queens problem is typically defined for N >= 4.")
         self.n = n
         # The maximum number of non-attacking pairs, which is the total number of pairs.
         # This is the fitness of a perfect solution.
         self.max_fitness = n * (n - 1) / 2
+        self.backend = backend or PYTHON_BACKEND
 
     def calculate(self, individual: Individual):
         """
         Calculates and assigns the fitness to the individual.
         Fitness = Total Pairs - Attacking Pairs
+        The individual is marked clean afterwards.
         """
-        chromosome = individual.chromosome
-        attacking_pairs = 0
-
-        # Horizontal and diagonal attacks. The representation already prevents vertical attacks.
-        for i in range(self.n):
-            for j in range(i + 1, self.n):
-                # Horizontal attack
-                if chromosome[i] == chromosome[j]:
-                    attacking_pairs += 1
-                # Diagonal attack
-                elif abs(i - j) == abs(chromosome[i] - chromosome[j]):
-                    attacking_pairs += 1
+        self.calculate_batch([individual])
 
-        individual.fitness = self.max_fitness - attacking_pairs
\ No newline at end of file
+    def calculate_batch(self, individuals: List[Individual]):
+        """
+        Calculates and assigns the fitness of several individuals in one
+        backend call. Horizontal and diagonal attacks are counted; the
+        representation already prevents vertical attacks.
+        """
+        attacking = self.backend.attacking_pairs([ind.chromosome for ind in individuals])
+        for individual, attacking_pairs in zip(individuals, attacking):
+            individual.fitness = self.max_fitness - attacking_pairs
+            individual.dirty = False
@@ -0,0 +1,34 @@
+from typing import List, Sequence, Tuple
+
+
+def board_symmetries(chromosome: Sequence[int]) -> List[Tuple[int, ...]]:
+    """
+    Returns the 8 images of a board under the dihedral group of the square
+    (4 rotations, each optionally mirrored).
+
+    The board must place exactly one queen per row (i.e. the chromosome is a
+    permutation), which holds for every complete N-Queens solution. Otherwise
+    the transposed boards cannot be expressed in the column -> row encoding.
+    """
+    n = len(chromosome)
+    if sorted(chromosome) != list(range(n)):
+        raise ValueError("Board symmetries are only defined for permutation chromosomes.")
+
+    # The transpose of a permutation board is its inverse permutation.
+    inverse = [0] * n
+    for col, row in enumerate(chromosome):
+        inverse[row] = col
+
+    images = []
+    for board in (list(chromosome), inverse):
+        mirrored_rows = [n - 1 - row for row in board]
+        images.append(tuple(board))
+        images.append(tuple(reversed(board)))
+        images.append(tuple(mirrored_rows))
+        images.append(tuple(reversed(mirrored_rows)))
+    return images
+
+
+def canonical_form(chromosome: Sequence[int]) -> Tuple[int, ...]:
+    """Returns the lexicographically smallest of the 8 symmetric images of a board."""
+    return min(board_symmetries(chromosome))
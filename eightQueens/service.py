@@ -0,0 +1,315 @@
+"""
+Long-running local N-Queens solver service.
+
+Usage:
+    python cli.py serve [--port 8765] [--unix /tmp/nqueens.sock] [--workers 4]
+    python cli.py loadtest [--port 8765] [--requests 200] [--concurrency 50] [--n 8 10 12]
+
+Endpoints (HTTP/1.1, JSON, one request per connection):
+    POST /solve   {"n": 20,                          # board size, 4 <= n <= MAX_N (required)
+                   "config": {"selection": ...},      # optional, same keys as a spec config except name/params
+                   "params": {"population_size": 200},  # optional overrides of main.BASE_PARAMS (see MAX_PARAMS)
+                   "time_budget": 10.0,               # optional, seconds (finite, > 0)
+                   "use_cache": true}                 # optional
+    GET  /stats   counters of the service
+
+A solve request is answered from the solution cache when a solution for N is
+known. Otherwise it joins the GA run already in progress for the same N and
+config, if there is one, or starts a new run on a worker process; every
+request waiting on a run receives its result. Runs that end without a
+solution are restarted while the request still has budget left. A request
+whose budget runs out is answered with status "timeout" while the shared run
+continues for the other requests.
+"""
+import asyncio
+import json
+import math
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+DEFAULT_CONFIG = {
+    "selection": {"type": "Tournament", "tournament_size": 3},
+    "crossover": "Uniform",
+    "mutation": "Swap",
+    "elitism": {"type": "BestN", "n": 2},
+    "initialization": "Permutation",
+}
+
+# Largest board the service accepts; the fitness of each individual is O(N^2).
+MAX_N = 1000
+# Upper bounds on the run parameters a request may override, so one request
+# cannot make a worker allocate or loop without limit.
+MAX_PARAMS = {"population_size": 5000, "num_generations": 100000}
+# Keys of a request's "config" that would change the run's identity or its N.
+RESERVED_CONFIG_KEYS = ("name", "params")
+# Largest request body, and most header lines, read from a connection.
+MAX_BODY_BYTES = 64 * 1024
+MAX_HEADERS = 100
+
+HTTP_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+                413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+def solve_in_worker(n: int, config_spec: dict, params: dict, time_limit: float) -> dict:
+    """Worker-process entry point: runs the GA once for up to `time_limit` seconds."""
+    from cli import build_configs
+    from main import execute_run
+
+    spec = {"params": params, "configs": [{"name": "service", **DEFAULT_CONFIG, **config_spec}]}
+    config = build_configs(spec, "service", n)[0]
+    result, best_solution = execute_run(config, 0, show_progress=True, time_limit=time_limit)
+    return {
+        "solution": list(best_solution.chromosome),
+        "fitness": best_solution.fitness,
+        "solution_found": result["solution_found"],
+        "evaluations": result["evaluations"],
+        "execution_time": result["execution_time"],
+    }
+
+
+class SolverService:
+    """
+    Answers solve requests from a solution cache or from GA runs on a pool
+    of worker processes, sharing one run among concurrent requests with the
+    same N and config.
+
+    Args:
+        num_workers (int): Worker processes for the GA runs.
+        archive: Optional SolutionArchive used to pre-fill the cache and to
+                 store the solutions found by the service.
+        default_time_budget (float): Budget of requests that do not set one.
+        max_time_budget (float): Upper bound on any request's budget.
+    """
+    def __init__(self, num_workers: Optional[int] = None, archive=None,
+                 default_time_budget: float = 10.0, max_time_budget: float = 120.0):
+        # Workers are started from a clean server process rather than forked from
+        # this one, so they do not inherit the listening and client sockets.
+        self.executor = ProcessPoolExecutor(max_workers=num_workers,
+                                            mp_context=multiprocessing.get_context("forkserver"))
+        self.archive = archive
+        self.default_time_budget = default_time_budget
+        self.max_time_budget = max_time_budget
+        self.cache: Dict[int, List[int]] = {}
+        if archive is not None:
+            for n in archive.board_sizes():
+                self.cache[n] = archive.boards(n)[0]
+        self._runs: Dict[Tuple, asyncio.Future] = {}
+        self.stats = {"requests": 0, "cache_hits": 0, "runs_started": 0, "batched_requests": 0,
+                      "solved_by_run": 0, "timeouts": 0, "errors": 0}
+
+    async def solve(self, request: dict) -> dict:
+        """Handles one solve request and returns the response body."""
+        self.stats["requests"] += 1
+        start = time.perf_counter()
+        n = int(request["n"])
+        if not 4 <= n <= MAX_N:
+            raise ValueError(f"n must be between 4 and {MAX_N}.")
+        config_spec = request.get("config", {})
+        params = request.get("params", {})
+        self._validate(config_spec, params)
+        budget = float(request.get("time_budget", self.default_time_budget))
+        if not math.isfinite(budget) or budget <= 0:
+            raise ValueError("time_budget must be a finite number of seconds greater than 0.")
+        budget = min(budget, self.max_time_budget)
+
+        if request.get("use_cache", True) and n in self.cache:
+            self.stats["cache_hits"] += 1
+            return self._response("solved", n, start, solution=self.cache[n], source="cache")
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + budget
+        key = (n, json.dumps(config_spec, sort_keys=True), json.dumps(params, sort_keys=True))
+        source = "run"
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            run = self._runs.get(key)
+            if run is None:
+                run = self._start_run(key, n, config_spec, params, remaining)
+            elif source == "run":
+                self.stats["batched_requests"] += 1
+                source = "batched"
+            try:
+                result = await asyncio.wait_for(asyncio.shield(run), remaining)
+            except asyncio.TimeoutError:
+                break
+            if self._solves(result, n):
+                self.stats["solved_by_run"] += 1
+                return self._response("solved", n, start, solution=result["solution"], source=source,
+                                      evaluations=result["evaluations"])
+        self.stats["timeouts"] += 1
+        return self._response("timeout", n, start)
+
+    def _start_run(self, key: Tuple, n: int, config_spec: dict, params: dict, time_limit: float) -> asyncio.Future:
+        """Submits a GA run to the pool; the run is shared until it finishes."""
+        self.stats["runs_started"] += 1
+        loop = asyncio.get_running_loop()
+        run = loop.run_in_executor(self.executor, solve_in_worker, n, config_spec, params, time_limit)
+        self._runs[key] = run
+
+        def finished(future: asyncio.Future):
+            self._runs.pop(key, None)
+            if future.cancelled() or future.exception() is not None:
+                return
+            result = future.result()
+            if self._solves(result, n):
+                self.cache.setdefault(n, result["solution"])
+                if self.archive is not None:
+                    self.archive.add(result["solution"], "service", 0)
+                    self.archive.save()
+
+        run.add_done_callback(finished)
+        return run
+
+    @staticmethod
+    def _validate(config_spec: dict, params: dict):
+        """Rejects configs and parameter overrides the service does not allow."""
+        if not isinstance(config_spec, dict) or not isinstance(params, dict):
+            raise TypeError("config and params must be JSON objects.")
+        reserved = [key for key in RESERVED_CONFIG_KEYS if key in config_spec]
+        if reserved:
+            raise ValueError(f"config may not set {reserved}; use the top-level n and params.")
+        if "n_queens" in params:
+            raise ValueError("params may not set n_queens; use n.")
+        for key, limit in MAX_PARAMS.items():
+            if key in params and not (isinstance(params[key], int) and 1 <= params[key] <= limit):
+                raise ValueError(f"params.{key} must be an integer between 1 and {limit}.")
+
+    @staticmethod
+    def _solves(result: dict, n: int) -> bool:
+        """True if a run's result is a solution for a board of size n."""
+        return result["solution_found"] and len(result["solution"]) == n
+
+    @staticmethod
+    def _response(status: str, n: int, start: float, **fields) -> dict:
+        return {"status": status, "n": n, "elapsed": time.perf_counter() - start, **fields}
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serves one HTTP request on a connection, then closes it."""
+        try:
+            request_line = (await reader.readline()).decode("latin-1").split()
+            headers = {}
+            while True:
+                line = (await reader.readline()).decode("latin-1").strip()
+                if not line:
+                    break
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+                if len(headers) > MAX_HEADERS:
+                    raise ValueError("Too many header lines.")
+            try:
+                content_length = int(headers.get("content-length", 0))
+            except ValueError:
+                content_length = -1
+            if content_length < 0:
+                self.stats["errors"] += 1
+                status, payload = 400, {"error": "Invalid Content-Length header."}
+            elif content_length > MAX_BODY_BYTES:
+                self.stats["errors"] += 1
+                status, payload = 413, {"error": f"Request body is larger than {MAX_BODY_BYTES} bytes."}
+            else:
+                body = await reader.readexactly(content_length)
+                status, payload = await self._route(request_line, body)
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            # ValueError: too many header lines, or a line longer than the stream's limit.
+            writer.close()
+            return
+        data = json.dumps(payload).encode("utf-8")
+        writer.write(
+            f"HTTP/1.1 {status} {HTTP_REASONS[status]}\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(data)}\r\nConnection: close\r\n\r\n".encode("latin-1") + data
+        )
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+        writer.close()
+
+    async def _route(self, request_line: List[str], body: bytes) -> Tuple[int, dict]:
+        if len(request_line) < 2:
+            return 400, {"error": "Malformed request line."}
+        method, path = request_line[0], request_line[1].split("?")[0]
+        if path == "/stats":
+            return 200, {**self.stats, "cached_sizes": sorted(self.cache), "active_runs": len(self._runs)}
+        if path != "/solve":
+            return 404, {"error": f"Unknown path {path}."}
+        if method != "POST":
+            return 405, {"error": "Use POST /solve."}
+        try:
+            request = json.loads(body or b"{}")
+            return 200, await self.solve(request)
+        except (KeyError, TypeError, ValueError) as error:
+            self.stats["errors"] += 1
+            return 400, {"error": f"Invalid solve request: {error!r}"}
+        except Exception as error:
+            self.stats["errors"] += 1
+            return 500, {"error": f"Solver failed: {error!r}"}
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8765, unix_path: Optional[str] = None):
+        """Serves until cancelled, on a TCP port or on a Unix socket."""
+        if unix_path:
+            server = await asyncio.start_unix_server(self.handle_connection, path=unix_path, backlog=1024)
+        else:
+            server = await asyncio.start_server(self.handle_connection, host, port, backlog=1024)
+        async with server:
+            await server.serve_forever()
+
+    def close(self):
+        self.executor.shutdown(cancel_futures=True)
+
+
+async def request(method: str, path: str, payload: Optional[dict] = None, host: str = "127.0.0.1",
+                  port: int = 8765, unix_path: Optional[str] = None) -> Tuple[int, dict]:
+    """Minimal client: sends one request to the service and returns (status code, JSON body)."""
+    if unix_path:
+        reader, writer = await asyncio.open_unix_connection(unix_path)
+    else:
+        reader, writer = await asyncio.open_connection(host, port)
+    body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode("latin-1") + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, data = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(data)
+
+
+async def run_load_test(n_values=(8, 10, 12), num_requests: int = 200, concurrency: int = 50,
+                        time_budget: float = 10.0, host: str = "127.0.0.1", port: int = 8765,
+                        unix_path: Optional[str] = None) -> dict:
+    """
+    Sends `num_requests` solve requests, cycling through `n_values`, with at
+    most `concurrency` in flight. Returns throughput, latency percentiles
+    (ms), a count per response status/source and the service's counters.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies, outcomes = [], {}
+
+    async def one(i: int):
+        async with semaphore:
+            start = time.perf_counter()
+            code, body = await request("POST", "/solve", {"n": n_values[i % len(n_values)],
+                                                          "time_budget": time_budget},
+                                       host, port, unix_path)
+            latencies.append((time.perf_counter() - start) * 1000)
+            outcome = f"{body.get('status', code)}/{body.get('source', '-')}"
+            outcomes[outcome] = outcomes.get(outcome, 0) + 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(num_requests)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    _, stats = await request("GET", "/stats", host=host, port=port, unix_path=unix_path)
+    return {
+        "requests": num_requests,
+        "requests_per_second": num_requests / elapsed,
+        "latency_p50_ms": latencies[len(latencies) // 2],
+        "latency_p95_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+        "latency_max_ms": latencies[-1],
+        "outcomes": outcomes,
+        "service_stats": stats,
+    }
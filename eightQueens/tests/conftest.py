@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The packages (core, ga, problem, utils) are imported relative to eightQueens/.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
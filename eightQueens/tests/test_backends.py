@@ -0,0 +1,107 @@
+import random
+
+import pytest
+
+from ga.backends import BACKENDS, PYTHON_BACKEND, get_backend
+from ga.genetic_algorithm import GeneticAlgorithm
+from ga.strategies.crossover import UniformCrossover
+from ga.strategies.elitism import BestNElitism
+from ga.strategies.mutation import SwapMutation
+from ga.strategies.selection import TournamentSelection
+
+N = 8
+TRIALS = 50
+
+AVAILABLE_BACKENDS = [name for name, backend_cls in BACKENDS.items() if backend_cls.is_available()]
+
+
+@pytest.fixture(params=AVAILABLE_BACKENDS)
+def backend(request):
+    return get_backend(request.param, seed=0)
+
+
+@pytest.fixture
+def boards():
+    rng = random.Random(0)
+    return [[rng.randrange(N) for _ in range(N)] for _ in range(TRIALS)]
+
+
+@pytest.fixture
+def parent_pairs(boards):
+    rng = random.Random(1)
+    return [(boards[rng.randrange(TRIALS)], boards[rng.randrange(TRIALS)]) for _ in range(TRIALS)]
+
+
+def test_fitness_matches_reference(backend, boards):
+    assert backend.attacking_pairs(boards) == PYTHON_BACKEND.attacking_pairs(boards)
+
+
+def test_fitness_edge_cases(backend):
+    assert backend.attacking_pairs([[0, 4, 7, 5, 2, 6, 1, 3]]) == [0]
+    assert backend.attacking_pairs([[0] * N]) == [N * (N - 1) // 2]
+    assert backend.attacking_pairs([]) == []
+
+
+def test_full_size_tournament_picks_the_best(backend):
+    fitnesses = [float(random.Random(2).randrange(100)) for _ in range(TRIALS)]
+    fitnesses[17] = 1000.0
+    assert backend.tournament_select(fitnesses, TRIALS, TRIALS) == [17] * TRIALS
+
+
+@pytest.mark.parametrize("tournament_size", [2, 3, 10])
+def test_tournament_contenders_are_distinct(backend, tournament_size):
+    # With distinct contenders the worst individual can never win.
+    fitnesses = [float(i) for i in range(TRIALS)]
+    selected = backend.tournament_select(fitnesses, 500, tournament_size)
+    assert len(selected) == 500
+    assert all(0 < i < TRIALS for i in selected)
+
+
+def test_roulette_only_picks_non_zero_fitness(backend):
+    assert backend.roulette_select([0.0] * 4 + [1.0], 20) == [4] * 20
+    assert len(backend.roulette_select([0.0] * 5, 7)) == 7
+
+
+def test_crossovers_recombine_parent_genes(backend, parent_pairs):
+    for parent1, parent2 in parent_pairs:
+        for child1, child2 in (backend.uniform_crossover(parent1, parent2, 0.5),
+                               backend.two_point_crossover(parent1, parent2)):
+            assert all(isinstance(gene, int) for gene in child1 + child2)
+            assert all({child1[k], child2[k]} == {parent1[k], parent2[k]} for k in range(N))
+        assert backend.uniform_crossover(parent1, parent2, 1.0) == (list(parent1), list(parent2))
+
+
+def test_in_place_crossovers_recombine_parent_genes(backend, parent_pairs):
+    out1, out2 = [-1] * N, [-1] * N
+    for parent1, parent2 in parent_pairs:
+        backend.uniform_crossover_into(parent1, parent2, out1, out2, 0.5)
+        assert all({out1[k], out2[k]} == {parent1[k], parent2[k]} for k in range(N))
+        backend.two_point_crossover_into(parent1, parent2, out1, out2)
+        assert all({out1[k], out2[k]} == {parent1[k], parent2[k]} for k in range(N))
+
+
+def test_mutation_kernels_stay_in_range(backend):
+    for _ in range(TRIALS):
+        idx1, idx2 = backend.swap_positions(N)
+        assert idx1 != idx2 and 0 <= idx1 < N and 0 <= idx2 < N
+        idx, value = backend.reset_gene(N)
+        assert 0 <= idx < N and 0 <= value < N
+
+
+def test_spawned_backends_are_reproducible(backend):
+    first, second = backend.spawn(42), backend.spawn(42)
+    assert first.tournament_select([1.0, 2.0, 3.0, 4.0], 10, 2) == second.tournament_select([1.0, 2.0, 3.0, 4.0], 10, 2)
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        get_backend("fortran")
+
+
+def test_engines_do_not_rebind_shared_strategies():
+    strategies = (TournamentSelection(3), UniformCrossover(), SwapMutation(), BestNElitism(2))
+    first = GeneticAlgorithm(8, *strategies, backend="python")
+    second = GeneticAlgorithm(8, *strategies, backend=AVAILABLE_BACKENDS[-1])
+    assert first.crossover_strategy.backend is PYTHON_BACKEND
+    assert second.crossover_strategy.backend is second.backend
+    assert all(strategy.backend is PYTHON_BACKEND for strategy in strategies[:3])
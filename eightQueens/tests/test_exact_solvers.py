@@ -0,0 +1,35 @@
+import pytest
+
+from ga.backends import PYTHON_BACKEND
+from problem.exact_solvers import SearchLimitReached, backtracking_solution, constructive_solution
+
+
+def is_solution(board):
+    return sorted(board) == list(range(len(board))) and PYTHON_BACKEND.attacking_pairs([board]) == [0]
+
+
+@pytest.mark.parametrize("n", [1, 4, 5, 8, 12, 20])
+def test_backtracking_finds_a_solution(n):
+    board = backtracking_solution(n)
+    assert is_solution(board)
+
+
+@pytest.mark.parametrize("n", [2, 3])
+def test_backtracking_reports_unsolvable_boards(n):
+    assert backtracking_solution(n) is None
+
+
+def test_backtracking_respects_the_node_budget():
+    with pytest.raises(SearchLimitReached):
+        backtracking_solution(30, max_nodes=10)
+
+
+@pytest.mark.parametrize("n", range(4, 41))
+def test_constructive_solution_covers_every_residue(n):
+    board = constructive_solution(n)
+    assert is_solution(board)
+
+
+def test_constructive_solution_rejects_small_boards():
+    with pytest.raises(ValueError):
+        constructive_solution(3)
@@ -0,0 +1,79 @@
+import random
+
+import pytest
+
+from ga.genetic_algorithm import GeneticAlgorithm
+from ga.steady_state import SteadyStateGeneticAlgorithm
+from ga.strategies.selection import TournamentSelection
+from ga.strategies.crossover import UniformCrossover
+from ga.strategies.mutation import SwapMutation
+from ga.strategies.elitism import BestNElitism
+from ga.strategies.replacement import (DeterministicCrowding, GenerationalReplacement, ReplacementStrategy,
+                                       UniqueReplacement)
+from utils.logger import Logger
+
+
+def make_ga(n_queens=10, engine=GeneticAlgorithm, **kwargs):
+    return engine(n_queens, TournamentSelection(3), UniformCrossover(), SwapMutation(), BestNElitism(2), **kwargs)
+
+
+def seeded_run(seed, ga, population_size=60, num_generations=80, **run_kwargs):
+    random.seed(seed)
+    best = ga.run(population_size, num_generations, 0.05, **run_kwargs)
+    return list(best.chromosome), best.fitness, ga.evaluations
+
+
+@pytest.mark.parametrize("engine", [GeneticAlgorithm, SteadyStateGeneticAlgorithm])
+def test_diversity_logging_does_not_change_the_search(tmp_path, engine):
+    without = seeded_run(5, make_ga(engine=engine))
+    logger = Logger(str(tmp_path / "log.csv"))
+    with_diversity = seeded_run(5, make_ga(engine=engine), logger=logger, diversity_interval=10)
+    assert without == with_diversity
+    assert "mean_hamming" in logger.log_data[0]
+
+
+def test_double_buffering_does_not_change_the_search():
+    double_buffered = seeded_run(3, make_ga(double_buffered=True))
+    allocating = seeded_run(3, make_ga(double_buffered=False))
+    assert double_buffered == allocating
+
+
+def test_steady_state_records_a_solution_bred_on_the_last_step():
+    # Seed 11 breeds the first solution on the last step of generation 0.
+    ga = make_ga(n_queens=6, engine=SteadyStateGeneticAlgorithm)
+    board, fitness, evaluations = seeded_run(11, ga, population_size=30, num_generations=1)
+    assert fitness == ga.fitness_calculator.max_fitness
+    assert ga.solution_generation == 1
+    assert ga.evaluations_to_solution == evaluations
+
+
+def test_steady_state_rejects_a_replacement_tournament_larger_than_the_population():
+    with pytest.raises(ValueError):
+        make_ga(engine=SteadyStateGeneticAlgorithm, replacement="tournament", replacement_tournament_size=0)
+    ga = make_ga(engine=SteadyStateGeneticAlgorithm, replacement="tournament", replacement_tournament_size=8)
+    with pytest.raises(ValueError):
+        ga.run(5, 10, 0.05)
+
+
+@pytest.mark.parametrize("make_replacement", [GenerationalReplacement, UniqueReplacement, DeterministicCrowding])
+def test_evaluations_do_not_depend_on_the_execution_path(monkeypatch, make_replacement):
+    # Perturbed survivors are evaluated again; how many there are depends on
+    # the random stream, which threaded workers draw from their own RNGs.
+    perturbations = []
+    perturb = ReplacementStrategy._perturb
+    monkeypatch.setattr(ReplacementStrategy, "_perturb",
+                        lambda self, *args: perturbations.append(1) or perturb(self, *args))
+
+    population_size, num_generations = 51, 40  # An odd number of offspring per generation
+    counts = []
+    for double_buffered, num_threads in ((False, 1), (True, 1), (False, 2)):
+        perturbations.clear()
+        ga = make_ga(n_queens=12, double_buffered=double_buffered, replacement_strategy=make_replacement())
+        ga.num_threads = num_threads  # Forced on, since the GIL build disables threads by default
+        seeded_run(0, ga, population_size=population_size, num_generations=num_generations)
+        assert ga.solution_generation is None
+        reevaluated = len(perturbations) if make_replacement is DeterministicCrowding else 0
+        counts.append((ga.evaluations - reevaluated, ga.offspring_produced))
+    kept = population_size - 2
+    expected_produced = (num_generations - 1) * kept if make_replacement is not GenerationalReplacement else 0
+    assert counts == [(population_size + (num_generations - 1) * kept, expected_produced)] * 3
@@ -0,0 +1,50 @@
+import pytest
+
+from core.individual import Individual
+from problem.n_queens import NQueensFitness
+
+
+def test_rejects_non_integer_genes():
+    with pytest.raises(ValueError):
+        Individual([0, 1.5, 2, 3])
+
+
+def test_gene_writes_mark_dirty():
+    individual = Individual([0, 1, 2, 3])
+    NQueensFitness(4).calculate(individual)
+    assert not individual.dirty
+
+    individual.swap_genes(0, 1)
+    assert individual.dirty and individual.chromosome == [1, 0, 2, 3]
+
+    NQueensFitness(4).calculate(individual)
+    individual.set_gene(2, 3)
+    assert individual.dirty
+
+    NQueensFitness(4).calculate(individual)
+    individual.writable_genes()[0] = 2
+    assert individual.dirty
+
+
+def test_copy_from_reuses_storage_and_copies_state():
+    source = Individual([1, 3, 0, 2])
+    NQueensFitness(4).calculate(source)
+    slot = Individual([0, 0, 0, 0])
+    storage = slot.chromosome
+
+    slot.copy_from(source)
+
+    assert slot.chromosome is storage
+    assert slot.chromosome == source.chromosome
+    assert slot.fitness == source.fitness and not slot.dirty
+    slot.swap_genes(0, 1)
+    assert source.chromosome == [1, 3, 0, 2]
+
+
+def test_assigning_chromosome_marks_dirty():
+    fitness = NQueensFitness(4)
+    individual = Individual([1, 3, 0, 2])
+    fitness.calculate(individual)
+    assert individual.fitness == fitness.max_fitness
+    individual.chromosome = [0, 0, 0, 0]
+    assert individual.dirty
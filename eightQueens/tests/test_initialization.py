@@ -0,0 +1,81 @@
+import random
+
+import pytest
+
+from ga.backends import PYTHON_BACKEND
+from ga.strategies.initialization import (GreedyMinConflictInitialization, MixedInitialization,
+                                          PermutationInitialization, RandomInitialization,
+                                          WarmStartInitialization)
+
+
+def mean_attacking_pairs(chromosomes):
+    return sum(PYTHON_BACKEND.attacking_pairs(chromosomes)) / len(chromosomes)
+
+
+@pytest.mark.parametrize("initializer", [
+    RandomInitialization(), PermutationInitialization(), GreedyMinConflictInitialization(),
+    MixedInitialization(0.5), WarmStartInitialization(),
+])
+def test_initializers_build_boards_of_the_right_shape(initializer):
+    chromosomes = initializer.create_chromosomes(15, 9)
+    assert len(chromosomes) == 15
+    assert all(len(board) == 9 and all(0 <= row < 9 for row in board) for board in chromosomes)
+
+
+def test_permutation_boards_use_each_row_once():
+    random.seed(0)
+    for board in PermutationInitialization().create_chromosomes(30, 12):
+        assert sorted(board) == list(range(12))
+
+
+def test_greedy_boards_have_far_fewer_conflicts_than_random_ones():
+    random.seed(0)
+    greedy = mean_attacking_pairs(GreedyMinConflictInitialization().create_chromosomes(30, 40))
+    uniform = mean_attacking_pairs(RandomInitialization().create_chromosomes(30, 40))
+    assert greedy < uniform / 5
+
+
+def test_mixed_initialization_respects_the_greedy_fraction():
+    random.seed(0)
+    chromosomes = MixedInitialization(greedy_fraction=0.3).create_chromosomes(20, 40)
+    greedy, permutations = chromosomes[:6], chromosomes[6:]
+    assert all(sorted(board) == list(range(40)) for board in permutations)
+    assert mean_attacking_pairs(greedy) < mean_attacking_pairs(permutations) / 3
+    assert all(sorted(board) == list(range(40))
+               for board in MixedInitialization(greedy_fraction=0.0).create_chromosomes(10, 40))
+    with pytest.raises(ValueError):
+        MixedInitialization(greedy_fraction=1.5)
+
+
+class FakeArchive:
+    def __init__(self, boards_by_n):
+        self.boards_by_n = boards_by_n
+
+    def boards(self, n):
+        return self.boards_by_n.get(n, [])
+
+    def board_sizes(self):
+        return sorted(self.boards_by_n)
+
+
+ARCHIVE = FakeArchive({6: [[1, 3, 5, 0, 2, 4]], 8: [[0, 4, 7, 5, 2, 6, 1, 3]]})
+
+
+def make_warm_start(**kwargs):
+    initializer = WarmStartInitialization(fraction=0.5, **kwargs)
+    initializer.sources = (ARCHIVE,)
+    return initializer
+
+
+def test_warm_start_seeds_same_n_solutions():
+    random.seed(0)
+    chromosomes = make_warm_start().create_chromosomes(10, 8)
+    assert len(chromosomes) == 10
+    assert PYTHON_BACKEND.attacking_pairs(chromosomes[:5]) == [0] * 5
+
+
+def test_warm_start_can_skip_same_n_solutions():
+    initializer = make_warm_start(same_n=False)
+    for board in initializer.seed_boards(8):
+        assert board[:6] == [1, 3, 5, 0, 2, 4]
+        assert len(board) == 8
@@ -0,0 +1,46 @@
+import json
+import os
+import runpy
+
+import main
+from utils.solution_archive import EliteArchive, SolutionArchive
+
+EXPERIMENT_NAMES = ["part_1_selection", "part_2_crossover", "part_3_elitism", "part_4_mutation",
+                    "part_5_scalability"]
+
+TINY_SPEC = {
+    "num_runs": 1,
+    "log_generations": False,
+    "params": {"n_queens": 6, "population_size": 30, "num_generations": 50},
+    "configs": [{
+        "name": "Tiny",
+        "selection": {"type": "Tournament", "tournament_size": 3},
+        "crossover": "Uniform",
+        "mutation": "Swap",
+        "elitism": {"type": "BestN", "n": 2},
+        "initialization": "Permutation",
+    }],
+}
+
+
+def test_running_main_as_a_script_shares_metrics_and_archives(tmp_path, monkeypatch, capsys):
+    specs_dir = tmp_path / "experiments"
+    specs_dir.mkdir()
+    for name in EXPERIMENT_NAMES:
+        (specs_dir / f"{name}.json").write_text(json.dumps({**TINY_SPEC, "folder": name}))
+    archive_path = str(tmp_path / "results" / "solution_archive.json")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("NQUEENS_METRICS_PORT", "0")
+    monkeypatch.setattr(main, "EXPERIMENTS_DIR", str(specs_dir))
+    monkeypatch.setattr(main, "METRICS", None)
+    monkeypatch.setattr(main, "SOLUTION_ARCHIVE", SolutionArchive(archive_path))
+    monkeypatch.setattr(main, "ELITE_ARCHIVE", EliteArchive(str(tmp_path / "results" / "elite_archive.json")))
+
+    runpy.run_path(main.__file__, run_name="__main__")
+
+    # The script's runs reported to the registry and archive of the `main` module.
+    assert "nqueens_generations_total" in main.METRICS.render()
+    archived = SolutionArchive(archive_path).counts_by_n()
+    assert archived and main.SOLUTION_ARCHIVE.counts_by_n() == archived
+    assert f"Distinct solutions archived per N: {archived}" in capsys.readouterr().out
+    assert os.path.exists(tmp_path / "results" / "part_5_scalability" / "summary.csv")
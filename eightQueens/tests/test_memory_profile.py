@@ -0,0 +1,48 @@
+import gc
+import random
+import tracemalloc
+
+import pytest
+
+from cli import build_configs
+from ga.genetic_algorithm import GeneticAlgorithm
+from ga.steady_state import SteadyStateGeneticAlgorithm
+from ga.strategies.crossover import UniformCrossover
+from ga.strategies.elitism import BestNElitism
+from ga.strategies.mutation import SwapMutation
+from ga.strategies.selection import TournamentSelection
+from main import execute_run
+from utils.memory_profile import AllocationProbe
+
+MEMORY_COLUMNS = {"peak_traced_kib", "allocated_kib_per_generation", "gc_collections", "gc_pause_ms",
+                  "peak_rss_mib"}
+
+
+class FailingMutation(SwapMutation):
+    def mutate(self, individual):
+        raise RuntimeError("mutation failed")
+
+
+@pytest.mark.parametrize("engine", [GeneticAlgorithm, SteadyStateGeneticAlgorithm])
+def test_probe_is_released_when_a_run_raises(engine):
+    assert not tracemalloc.is_tracing()
+    probe = AllocationProbe()
+    ga = engine(8, TournamentSelection(3), UniformCrossover(), FailingMutation(), BestNElitism(2))
+    random.seed(0)
+    with pytest.raises(RuntimeError):
+        ga.run(20, 10, 1.0, metrics=probe)
+    assert probe._on_gc not in gc.callbacks
+    assert not tracemalloc.is_tracing()
+
+
+@pytest.mark.parametrize("profile_memory", [False, True])
+def test_profile_memory_adds_the_summary_columns(profile_memory):
+    spec = {
+        "params": {"population_size": 20, "num_generations": 5, "profile_memory": profile_memory},
+        "configs": [{"name": "Probe", "selection": {"type": "Tournament", "tournament_size": 3},
+                     "crossover": "Uniform", "mutation": "Swap", "elitism": {"type": "BestN", "n": 2}}],
+    }
+    config = build_configs(spec, "memory_test", 8)[0]
+    result, _ = execute_run(config, 0, show_progress=True)
+    assert (MEMORY_COLUMNS & result.keys()) == (MEMORY_COLUMNS if profile_memory else set())
+    assert not tracemalloc.is_tracing()
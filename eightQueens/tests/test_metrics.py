@@ -0,0 +1,41 @@
+import random
+import urllib.request
+
+from ga.genetic_algorithm import GeneticAlgorithm
+from ga.strategies.crossover import UniformCrossover
+from ga.strategies.elitism import BestNElitism
+from ga.strategies.mutation import SwapMutation
+from ga.strategies.selection import TournamentSelection
+from utils.metrics import MetricsRegistry, MetricsServer
+
+
+def scrape(url: str) -> dict:
+    """Returns {metric line name with labels: value} from a Prometheus text page."""
+    with urllib.request.urlopen(url, timeout=5) as response:
+        assert response.status == 200
+        text = response.read().decode("utf-8")
+    samples = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            name, _, value = line.rpartition(" ")
+            samples[name] = float(value)
+    return samples
+
+
+def test_metrics_endpoint_serves_the_counters_of_a_run():
+    registry = MetricsRegistry()
+    server = MetricsServer(registry, port=0).start()
+    try:
+        ga = GeneticAlgorithm(12, TournamentSelection(3), UniformCrossover(), SwapMutation(), BestNElitism(2))
+        random.seed(0)
+        ga.run(50, 30, 0.05, metrics=registry.run_metrics(config="test", run=0))
+        samples = scrape(server.url)
+    finally:
+        server.stop()
+
+    labels = '{config="test",run="0"}'
+    assert ga.solution_generation is None
+    assert samples[f"nqueens_generations_total{labels}"] == 30
+    assert samples[f"nqueens_evaluations_total{labels}"] == ga.evaluations
+    assert samples[f"nqueens_max_fitness{labels}"] == ga.fitness_calculator.max_fitness
+    assert samples[f"nqueens_run_active{labels}"] == 0
@@ -0,0 +1,81 @@
+import random
+
+import pytest
+
+from core.individual import Individual
+from core.population import Population
+from ga.backends import get_backend
+from ga.strategies.replacement import DeterministicCrowding, GenerationalReplacement, UniqueReplacement
+from ga.strategies.selection import TournamentSelection
+from problem.n_queens import NQueensFitness
+
+N = 8
+
+
+def individuals(boards):
+    return [Individual(list(board)) for board in boards]
+
+
+def evaluator(n=N):
+    fitness = NQueensFitness(n)
+    return fitness.calculate_batch
+
+
+def test_generational_replacement_only_counts_duplicates_when_asked():
+    elites = individuals([[0, 1, 2, 3, 4, 5, 6, 7]])
+    offspring = individuals([[0, 1, 2, 3, 4, 5, 6, 7]] * 4)
+    assert GenerationalReplacement().replace([], offspring, elites, evaluator()) is None
+    assert GenerationalReplacement(count_duplicates=True).replace([], offspring, elites, evaluator()) == 4
+
+
+def test_unique_replacement_removes_duplicates_with_the_backend_rng():
+    strategy = UniqueReplacement(max_attempts=0)  # Every duplicate is shuffled
+    strategy.backend = get_backend("python", seed=0)
+    elites = individuals([list(range(N))])
+    offspring = individuals([list(range(N))] * 5)
+    state = random.getstate()
+    assert strategy.replace([], offspring, elites, evaluator()) == 5
+    assert random.getstate() == state
+    genomes = {tuple(ind.chromosome) for ind in elites + offspring}
+    assert len(genomes) == 6
+    assert all(child.dirty for child in offspring)
+
+
+def test_crowding_pairs_a_shuffled_population():
+    strategy = DeterministicCrowding()
+    strategy.backend = get_backend("python", seed=0)
+    population = Population(individuals([[i] * N for i in range(6)]))
+    parents = strategy.select_parents(population, 6, TournamentSelection(3))
+    assert sorted(id(parent) for parent in parents) == sorted(id(ind) for ind in population.individuals)
+    assert len(strategy.select_parents(population, 8, TournamentSelection(3))) == 8
+
+
+@pytest.mark.parametrize("backend_name", ["python", "numpy"])
+def test_crowding_does_not_flood_the_population_with_a_surviving_parent(backend_name):
+    if backend_name == "numpy":
+        pytest.importorskip("numpy")
+    strategy = DeterministicCrowding()
+    strategy.backend = get_backend(backend_name, seed=0)
+    evaluate = evaluator()
+    solution = [0, 4, 7, 5, 2, 6, 1, 3]
+    # The same fit parent in every pair, with children that are all worse than it.
+    parents = individuals([solution] * 6)
+    offspring = individuals([[0] * N] * 6)
+    evaluate(parents)
+    duplicates = strategy.replace(parents, offspring, [], evaluate)
+    genomes = [tuple(child.chromosome) for child in offspring]
+    assert len(set(genomes)) == len(genomes)
+    assert tuple(solution) in genomes
+    assert duplicates == 5
+
+
+def test_crowding_decides_a_child_whose_sibling_was_dropped():
+    strategy = DeterministicCrowding()
+    evaluate = evaluator()
+    solution = [0, 4, 7, 5, 2, 6, 1, 3]
+    parents = individuals([[3] * N, [5] * N, solution, [1] * N])
+    # The last child is one gene away from the solution and worse than it.
+    offspring = individuals([[3] * N, [5] * N, [2] + solution[1:]])
+    evaluate(parents)
+    strategy.replace(parents, offspring, [], evaluate)
+    assert offspring[2].chromosome == solution
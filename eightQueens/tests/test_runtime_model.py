@@ -0,0 +1,61 @@
+import json
+import math
+
+import pytest
+
+from main import BASE_PARAMS
+from utils.runtime_model import RuntimeModel, load_runtime_history, lpt_order, simulate_makespan
+
+
+def synthetic_rows(n_exponent=2.5, rate=1e-7, slow_factor=3.0):
+    rows = []
+    for n in (8, 16, 32, 64):
+        for population_size, num_generations in ((100, 200), (200, 500)):
+            for config_name, factor in (("fast", 1.0), ("slow", slow_factor)):
+                rows.append({
+                    "n_queens": n, "population_size": population_size, "num_generations": num_generations,
+                    "config_name": config_name,
+                    "execution_time": factor * rate * population_size * num_generations * n ** n_exponent,
+                })
+    return rows
+
+
+def test_fit_recovers_the_exponent_and_config_offsets():
+    model = RuntimeModel.fit(synthetic_rows())
+    assert model.n_exponent == pytest.approx(2.5)
+    assert model.offsets["slow"] - model.offsets["fast"] == pytest.approx(math.log(3.0))
+    expected = 3.0 * 1e-7 * 150 * 300 * 20 ** 2.5
+    assert model.predict(20, 150, 300, "slow") == pytest.approx(expected)
+    # An unknown configuration gets the average offset.
+    assert model.predict(20, 150, 300, "fast") < model.predict(20, 150, 300, "new") < expected
+
+
+def test_fit_without_rows_keeps_the_defaults():
+    model = RuntimeModel.fit([])
+    assert model.num_samples == 0 and model.n_exponent == 2.0
+
+
+def test_lpt_order_beats_spec_order():
+    durations = [1.0, 1.0, 1.0, 1.0, 4.0]
+    assert lpt_order(durations) == [4, 0, 1, 2, 3]
+    spec_makespan, _ = simulate_makespan(durations, range(len(durations)), 2)
+    lpt_makespan, finish_times = simulate_makespan(durations, lpt_order(durations), 2)
+    assert (spec_makespan, lpt_makespan) == (6.0, 4.0)
+    assert finish_times == [1.0, 2.0, 3.0, 4.0, 4.0]
+
+
+def test_history_fills_missing_columns_from_the_spec_and_defaults(tmp_path):
+    results_dir, specs_dir = tmp_path / "results", tmp_path / "experiments"
+    (results_dir / "sweep").mkdir(parents=True)
+    specs_dir.mkdir()
+    (specs_dir / "sweep.json").write_text(json.dumps({"folder": "sweep", "params": {"population_size": 50}}))
+    (results_dir / "sweep" / "summary.csv").write_text(
+        "config_name,n_queens,execution_time\n"
+        "A,12,1.5\n"
+        ",12,2.0\n"  # Rows without a config are skipped
+    )
+    rows = load_runtime_history(str(results_dir), str(specs_dir), BASE_PARAMS)
+    assert rows == [{"n_queens": 12, "population_size": 50, "num_generations": BASE_PARAMS["num_generations"],
+                     "config_name": "A", "execution_time": 1.5}]
+    # Without the spec and the defaults the parameters are unknown, so the row is dropped.
+    assert load_runtime_history(str(results_dir)) == []
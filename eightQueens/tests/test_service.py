@@ -0,0 +1,101 @@
+import asyncio
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import service
+from problem.exact_solvers import constructive_solution
+from service import MAX_BODY_BYTES, MAX_N, SolverService
+
+WORKER_SECONDS = 0.2
+
+
+@pytest.fixture
+def service_calls(monkeypatch):
+    """Replaces the GA worker with a fast stand-in that records its calls."""
+    calls = []
+
+    def fake_solve_in_worker(n, config_spec, params, time_limit):
+        calls.append(n)
+        time.sleep(WORKER_SECONDS)
+        solution = params.get("solution_size", n)
+        return {"solution": constructive_solution(solution), "fitness": 0.0, "solution_found": True,
+                "evaluations": 1, "execution_time": WORKER_SECONDS}
+
+    monkeypatch.setattr(service, "solve_in_worker", fake_solve_in_worker)
+    return calls
+
+
+@pytest.fixture
+def solver():
+    solver = SolverService(num_workers=1)
+    solver.executor.shutdown()
+    solver.executor = ThreadPoolExecutor(max_workers=4)
+    yield solver
+    solver.close()
+
+
+def solve_all(solver, *requests):
+    async def gather():
+        return await asyncio.gather(*(solver.solve(request) for request in requests))
+    return asyncio.run(gather())
+
+
+@pytest.mark.parametrize("request_body", [
+    {"n": 3}, {"n": MAX_N + 1}, {"n": 8, "time_budget": 0}, {"n": 8, "time_budget": -1.0},
+    {"n": 8, "time_budget": math.nan}, {"n": 8, "time_budget": math.inf},
+    {"n": 9, "config": {"params": {"n_queens": 14}}}, {"n": 9, "config": {"name": "other"}},
+    {"n": 9, "params": {"n_queens": 14}}, {"n": 9, "params": {"population_size": 10 ** 9}},
+    {"n": 9, "params": {"num_generations": 0}},
+])
+def test_solve_rejects_invalid_requests(solver, service_calls, request_body):
+    with pytest.raises(ValueError):
+        solve_all(solver, request_body)
+    assert service_calls == []
+
+
+def test_concurrent_requests_share_one_run_and_then_hit_the_cache(solver, service_calls):
+    responses = solve_all(solver, *[{"n": 10}] * 5)
+    assert [response["status"] for response in responses] == ["solved"] * 5
+    assert sorted(response["source"] for response in responses) == ["batched"] * 4 + ["run"]
+    assert solver.stats["runs_started"] == 1 and solver.stats["batched_requests"] == 4
+
+    (cached,) = solve_all(solver, {"n": 10})
+    assert cached["source"] == "cache" and cached["solution"] == responses[0]["solution"]
+    assert service_calls == [10]
+
+
+def test_a_request_out_of_budget_times_out_while_others_get_the_result(solver, service_calls):
+    patient, impatient = solve_all(solver, {"n": 12, "time_budget": 5.0}, {"n": 12, "time_budget": 0.05})
+    assert impatient["status"] == "timeout"
+    assert patient["status"] == "solved" and len(patient["solution"]) == 12
+    assert solver.stats["runs_started"] == 1 and solver.stats["timeouts"] == 1
+
+
+def test_a_result_for_another_board_size_is_not_cached(solver, service_calls):
+    (response,) = solve_all(solver, {"n": 9, "params": {"solution_size": 14}, "time_budget": 0.5})
+    assert response["status"] == "timeout"
+    assert solver.cache == {}
+
+
+def exchange(solver, raw_request: bytes) -> bytes:
+    async def send() -> bytes:
+        server = await asyncio.start_server(solver.handle_connection, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(raw_request)
+            await writer.drain()
+            response = await asyncio.wait_for(reader.read(), 5)
+            writer.close()
+        return response
+    return asyncio.run(send())
+
+
+@pytest.mark.parametrize("length, status", [(b"abc", b"400"), (b"-5", b"400"),
+                                            (str(MAX_BODY_BYTES + 1).encode(), b"413")])
+def test_invalid_content_length_is_rejected(solver, length, status):
+    response = exchange(solver, b"POST /solve HTTP/1.1\r\nContent-Length: " + length + b"\r\n\r\n")
+    assert response.startswith(b"HTTP/1.1 " + status + b" ")
@@ -0,0 +1,47 @@
+from itertools import permutations
+
+import pytest
+
+from problem.symmetry import board_symmetries, canonical_form
+from utils.solution_archive import SolutionArchive
+
+
+def is_solution(board):
+    return all(abs(board[i] - board[j]) != j - i for i in range(len(board)) for j in range(i + 1, len(board)))
+
+
+EIGHT_QUEENS_SOLUTIONS = [board for board in permutations(range(8)) if is_solution(board)]
+
+
+def test_eight_queens_has_12_solutions_up_to_symmetry():
+    assert len(EIGHT_QUEENS_SOLUTIONS) == 92
+    assert len({canonical_form(board) for board in EIGHT_QUEENS_SOLUTIONS}) == 12
+
+
+def test_symmetries_of_a_solution_are_solutions_with_the_same_canonical_form():
+    board = EIGHT_QUEENS_SOLUTIONS[0]
+    images = board_symmetries(board)
+    assert len(images) == 8 and tuple(board) in images
+    for image in images:
+        assert is_solution(image)
+        assert canonical_form(image) == canonical_form(board)
+
+
+def test_symmetries_require_a_permutation():
+    with pytest.raises(ValueError):
+        board_symmetries([0, 0, 1, 2])
+
+
+def test_archive_counts_symmetric_variants_once(tmp_path):
+    path = str(tmp_path / "archive.json")
+    board = EIGHT_QUEENS_SOLUTIONS[0]
+    archive = SolutionArchive(path)
+    assert archive.add(board, "config", 0)
+    assert not archive.add(tuple(reversed(board)), "config", 1)
+    assert archive.count_distinct(8) == 1
+    assert len(archive.lookup(board)) == 2
+
+    archive.save()
+    reloaded = SolutionArchive(path)
+    assert reloaded.counts_by_n() == {8: 1}
+    assert reloaded.boards(8) == [list(canonical_form(board))]
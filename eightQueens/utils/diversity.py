@@ -0,0 +1,55 @@
+import math
+import random
+from collections import Counter
+from typing import Dict, Optional
+
+from core.population import Population
+
+
+def unique_genome_count(population: Population) -> int:
+    """Returns the number of distinct chromosomes in the population."""
+    return len({tuple(ind.chromosome) for ind in population.individuals})
+
+
+def mean_hamming_distance(population: Population, num_samples: int = 100,
+                          rng: Optional[random.Random] = None) -> float:
+    """
+    Estimates the mean pairwise Hamming distance by sampling random pairs
+    instead of comparing all O(P^2) pairs.
+    """
+    individuals = population.individuals
+    if len(individuals) < 2:
+        return 0.0
+    rng = rng or random
+    total = 0
+    for _ in range(num_samples):
+        a, b = rng.sample(individuals, 2)
+        total += sum(1 for x, y in zip(a.chromosome, b.chromosome) if x != y)
+    return total / num_samples
+
+
+def mean_locus_entropy(population: Population) -> float:
+    """
+    Returns the Shannon entropy (in bits) of the gene values at each locus,
+    averaged over all loci. 0 means every individual agrees on every gene.
+    """
+    individuals = population.individuals
+    if not individuals:
+        return 0.0
+    size = len(individuals)
+    num_loci = len(individuals[0])
+    total_entropy = 0.0
+    for locus in range(num_loci):
+        counts = Counter(ind.chromosome[locus] for ind in individuals)
+        total_entropy -= sum((c / size) * math.log2(c / size) for c in counts.values())
+    return total_entropy / num_loci
+
+
+def diversity_metrics(population: Population, num_samples: int = 100,
+                      rng: Optional[random.Random] = None) -> Dict[str, float]:
+    """Computes all diversity metrics for a population in roughly linear time."""
+    return {
+        'unique_genomes': unique_genome_count(population),
+        'mean_hamming': mean_hamming_distance(population, num_samples, rng),
+        'locus_entropy': mean_locus_entropy(population),
+    }
@@ -1,5 +1,5 @@
-import pandas as pd
 import os
+from typing import Dict, Optional
 
 class Logger:
     """
@@ -16,19 +16,28 @@ class Logger:
         if dir_name:
             os.makedirs(dir_name, exist_ok=True)
 
-    def log_generation(self, generation: int, best_fitness: float, avg_fitness: float, worst_fitness: float):
-        """Logs the metrics for a single generation."""
-        self.log_data.append({
+    def log_generation(self, generation: int, best_fitness: float, avg_fitness: float, worst_fitness: float,
+                       diversity: Optional[Dict[str, float]] = None):
+        """
+        Logs the metrics for a single generation.
+        Diversity metrics, when given, are added as extra columns; generations
+        without them are left empty in the CSV.
+        """
+        row = {
             'generation': generation,
             'best_fitness': best_fitness,
             'avg_fitness': avg_fitness,
             'worst_fitness': worst_fitness
-        })
+        }
+        if diversity:
+            row.update(diversity)
+        self.log_data.append(row)
 
     def save(self):
         """Saves the logged data to a CSV file."""
         if not self.log_data:
             return # Nothing to save
+        import pandas as pd  # imported lazily: it dominates process startup time
         df = pd.DataFrame(self.log_data)
         df.to_csv(self.filepath, index=False)
         # print(f"Log saved to {self.filepath}")
@@ -0,0 +1,103 @@
+import gc
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+
+try:
+    import resource  # Unix only
+except ImportError:
+    resource = None
+
+
+def peak_rss_mib() -> Optional[float]:
+    """
+    Returns the peak resident set size of this process in MiB, or None where
+    the `resource` module is unavailable (Windows). This is a process-wide
+    high-water mark, not a per-run value.
+    """
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes.
+    return max_rss / (1024 * 1024) if sys.platform == "darwin" else max_rss / 1024
+
+
+class AllocationProbe:
+    """
+    Per-generation allocation and garbage-collection probe.
+
+    It implements the same hooks as utils.metrics.RunMetrics (start,
+    observe_generation, finish), so it can be passed to GeneticAlgorithm.run
+    as `metrics`. For every generation it records, using tracemalloc, the
+    bytes allocated transiently above the previous generation's level and the
+    bytes retained, plus the number of GC collections and their total pause.
+    Tracing slows the run down noticeably, so it is only enabled on request.
+    """
+    def __init__(self):
+        self.generations: List[Dict[str, float]] = []
+        self._started_tracing = False
+        self._start_current = 0
+        self._last_current = 0
+        self._peak_traced = 0
+        self._gc_collections = 0
+        self._gc_pause = 0.0
+        self._gc_start = 0.0
+
+    def _on_gc(self, phase: str, info: dict):
+        if phase == "start":
+            self._gc_start = time.perf_counter()
+        else:
+            self._gc_collections += 1
+            self._gc_pause += time.perf_counter() - self._gc_start
+
+    def start(self, max_fitness: float = 0.0):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        gc.callbacks.append(self._on_gc)
+        tracemalloc.reset_peak()
+        self.generations = []
+        self._start_current = self._last_current = tracemalloc.get_traced_memory()[0]
+        self._peak_traced = 0
+
+    def observe_generation(self, best_fitness: float = 0.0, evaluations: int = 0,
+                           phase_seconds: Optional[Dict[str, float]] = None):
+        current, peak = tracemalloc.get_traced_memory()
+        self._peak_traced = max(self._peak_traced, peak - self._start_current)
+        self.generations.append({
+            "allocated_bytes": peak - self._last_current,
+            "retained_bytes": current - self._last_current,
+            "gc_collections": self._gc_collections,
+            "gc_pause_ms": self._gc_pause * 1000,
+        })
+        self._gc_collections = 0
+        self._gc_pause = 0.0
+        tracemalloc.reset_peak()
+        self._last_current = current
+
+    def finish(self, best_fitness: Optional[float] = None):
+        self._peak_traced = max(self._peak_traced, tracemalloc.get_traced_memory()[1] - self._start_current)
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def summary(self) -> Dict[str, float]:
+        """Mean of each measurement per generation, skipping the first (initial evaluation)."""
+        rows = self.generations[1:] or self.generations
+        if not rows:
+            return {}
+        return {key: sum(row[key] for row in rows) / len(rows) for key in rows[0]}
+
+    def run_summary(self) -> Dict[str, Optional[float]]:
+        """Run-level columns for an experiment summary row."""
+        per_generation = self.summary()
+        return {
+            "peak_traced_kib": self._peak_traced / 1024,
+            "allocated_kib_per_generation": per_generation.get("allocated_bytes", 0.0) / 1024,
+            "gc_collections": sum(row["gc_collections"] for row in self.generations),
+            "gc_pause_ms": sum(row["gc_pause_ms"] for row in self.generations),
+            "peak_rss_mib": peak_rss_mib(),
+        }
@@ -0,0 +1,161 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+
+# name -> (type, help text)
+METRIC_DEFINITIONS: Dict[str, Tuple[str, str]] = {
+    "nqueens_generations_total": ("counter", "Generations completed."),
+    "nqueens_evaluations_total": ("counter", "Fitness evaluations performed."),
+    "nqueens_best_fitness": ("gauge", "Best fitness found so far."),
+    "nqueens_max_fitness": ("gauge", "Fitness of a perfect solution."),
+    "nqueens_generations_per_second": ("gauge", "Generations per second since the run started."),
+    "nqueens_evaluations_per_second": ("gauge", "Fitness evaluations per second since the run started."),
+    "nqueens_phase_seconds_total": ("counter", "Time spent in each phase of the GA loop."),
+    "nqueens_run_active": ("gauge", "1 while the run is in progress, 0 once it finished."),
+}
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class MetricsRegistry:
+    """
+    Thread-safe store of counters and gauges, rendered in the Prometheus
+    text exposition format. Writers only update a dict under a short lock,
+    so the GA loop never waits on a scrape.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values: Dict[str, Dict[Labels, float]] = {name: {} for name in METRIC_DEFINITIONS}
+
+    def set(self, name: str, value: float, labels: Labels):
+        with self._lock:
+            self._values[name][labels] = value
+
+    def inc(self, name: str, amount: float, labels: Labels):
+        with self._lock:
+            series = self._values[name]
+            series[labels] = series.get(labels, 0.0) + amount
+
+    def get(self, name: str, labels: Labels) -> Optional[float]:
+        with self._lock:
+            return self._values[name].get(labels)
+
+    def run_metrics(self, **labels: str) -> "RunMetrics":
+        """Returns a handle that records the metrics of one GA run under the given labels."""
+        return RunMetrics(self, tuple(sorted((key, str(value)) for key, value in labels.items())))
+
+    def render(self) -> str:
+        """Returns all metrics in the Prometheus text format."""
+        lines = []
+        with self._lock:
+            snapshot = {name: dict(series) for name, series in self._values.items()}
+        for name, series in snapshot.items():
+            if not series:
+                continue
+            metric_type, help_text = METRIC_DEFINITIONS[name]
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for labels, value in series.items():
+                label_text = ",".join(f'{key}="{_escape_label_value(val)}"' for key, val in labels)
+                lines.append(f"{name}{{{label_text}}} {value!r}" if label_text else f"{name} {value!r}")
+        return "\n".join(lines) + "\n"
+
+
+class RunMetrics:
+    """Metrics handle for a single GA run, fed by GeneticAlgorithm.run once per generation."""
+    def __init__(self, registry: MetricsRegistry, labels: Labels):
+        self.registry = registry
+        self.labels = labels
+        self._start_time = time.perf_counter()
+        self._generations = 0
+        self._evaluations = 0
+
+    def start(self, max_fitness: float):
+        """Marks the run as active and resets its throughput clock."""
+        self._start_time = time.perf_counter()
+        self.registry.set("nqueens_max_fitness", max_fitness, self.labels)
+        self.registry.set("nqueens_run_active", 1, self.labels)
+
+    def observe_generation(self, best_fitness: float, evaluations: int, phase_seconds: Dict[str, float]):
+        """Records one completed generation: best fitness, new evaluations and time per phase."""
+        self._generations += 1
+        self._evaluations += evaluations
+        elapsed = max(time.perf_counter() - self._start_time, 1e-9)
+        registry, labels = self.registry, self.labels
+        registry.inc("nqueens_generations_total", 1, labels)
+        registry.inc("nqueens_evaluations_total", evaluations, labels)
+        registry.set("nqueens_best_fitness", best_fitness, labels)
+        registry.set("nqueens_generations_per_second", self._generations / elapsed, labels)
+        registry.set("nqueens_evaluations_per_second", self._evaluations / elapsed, labels)
+        for phase, seconds in phase_seconds.items():
+            registry.inc("nqueens_phase_seconds_total", seconds, labels + (("phase", phase),))
+
+    def finish(self, best_fitness: Optional[float] = None):
+        """Marks the run as finished, optionally recording its final best fitness."""
+        if best_fitness is not None:
+            self.registry.set("nqueens_best_fitness", best_fitness, self.labels)
+        self.registry.set("nqueens_run_active", 0, self.labels)
+
+
+class MetricsServer:
+    """
+    Serves a registry at http://<host>:<port>/metrics from a background
+    daemon thread. Binds to localhost by default; port 0 picks a free port.
+    """
+    def __init__(self, registry: MetricsRegistry, host: str = "127.0.0.1", port: int = 9100):
+        self.registry = registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(handler):
+                if handler.path.split("?")[0] != "/metrics":
+                    handler.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                handler.send_response(200)
+                handler.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                handler.send_header("Content-Length", str(len(body)))
+                handler.end_headers()
+                handler.wfile.write(body)
+
+            def log_message(handler, format, *args):
+                pass  # Keep the experiment output clean
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/metrics"
+
+    def start(self) -> "MetricsServer":
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class MetricsGroup:
+    """Forwards the run hooks (start, observe_generation, finish) to several metrics handles."""
+    def __init__(self, *handles):
+        self.handles = [handle for handle in handles if handle is not None]
+
+    def start(self, max_fitness: float):
+        for handle in self.handles:
+            handle.start(max_fitness)
+
+    def observe_generation(self, best_fitness: float, evaluations: int, phase_seconds: Dict[str, float]):
+        for handle in self.handles:
+            handle.observe_generation(best_fitness, evaluations, phase_seconds)
+
+    def finish(self, best_fitness: Optional[float] = None):
+        for handle in self.handles:
+            handle.finish(best_fitness)
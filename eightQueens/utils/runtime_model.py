@@ -0,0 +1,119 @@
+import csv
+import glob
+import heapq
+import json
+import math
+import os
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Columns older summaries may lack; they are filled from the experiment spec
+# that wrote the folder, or from these defaults.
+MODEL_PARAMS = ("n_queens", "population_size", "num_generations")
+
+
+class RuntimeModel:
+    """
+    Predicts the execution time of a GA run from its parameters.
+
+    The work of a run grows with population_size * num_generations (one
+    evaluation per individual per generation) and with a power of N (the
+    fitness function is O(N^2)), so the model is
+
+        log(t / (population_size * num_generations)) = intercept + n_exponent * log(N) + offset[config]
+
+    The intercept and exponent are a least-squares fit over all past runs;
+    each configuration's offset is its mean residual, so a configuration that
+    was never run gets offset 0 (the average one).
+    """
+    def __init__(self, intercept: float = math.log(1e-6), n_exponent: float = 2.0,
+                 offsets: Optional[Dict[str, float]] = None, num_samples: int = 0):
+        self.intercept = intercept
+        self.n_exponent = n_exponent
+        self.offsets = offsets or {}
+        self.num_samples = num_samples
+
+    @classmethod
+    def fit(cls, rows: Sequence[dict]) -> "RuntimeModel":
+        """
+        Fits the model to summary rows with n_queens, population_size,
+        num_generations, config_name and execution_time. With no rows the
+        defaults are kept; if every row has the same N the exponent stays at 2.
+        """
+        samples = [
+            (math.log(row["n_queens"]),
+             math.log(row["execution_time"] / (row["population_size"] * row["num_generations"])),
+             row["config_name"])
+            for row in rows if row["execution_time"] > 0
+        ]
+        if not samples:
+            return cls()
+
+        mean_x = sum(x for x, _, _ in samples) / len(samples)
+        mean_y = sum(y for _, y, _ in samples) / len(samples)
+        var_x = sum((x - mean_x) ** 2 for x, _, _ in samples)
+        if var_x > 0:
+            n_exponent = sum((x - mean_x) * (y - mean_y) for x, y, _ in samples) / var_x
+        else:
+            n_exponent = 2.0
+        intercept = mean_y - n_exponent * mean_x
+
+        residuals: Dict[str, List[float]] = {}
+        for x, y, config_name in samples:
+            residuals.setdefault(config_name, []).append(y - intercept - n_exponent * x)
+        offsets = {name: sum(values) / len(values) for name, values in residuals.items()}
+        return cls(intercept, n_exponent, offsets, len(samples))
+
+    def predict(self, n_queens: int, population_size: int, num_generations: int, config_name: str = "") -> float:
+        """Returns the predicted execution time of one run, in seconds."""
+        log_rate = self.intercept + self.n_exponent * math.log(n_queens) + self.offsets.get(config_name, 0.0)
+        return population_size * num_generations * math.exp(log_rate)
+
+
+def load_runtime_history(results_dir: str, specs_dir: Optional[str] = None,
+                         defaults: Optional[dict] = None) -> List[dict]:
+    """
+    Reads every results/<folder>/summary.csv with an execution_time column.
+    Parameters a summary does not record are taken from the spec in
+    `specs_dir` whose "folder" matches, then from `defaults`.
+    """
+    folder_params: Dict[str, dict] = {}
+    for spec_path in glob.glob(os.path.join(specs_dir, "*.json")) if specs_dir else []:
+        with open(spec_path, "r", encoding="utf-8") as f:
+            spec = json.load(f)
+        folder_params[spec.get("folder")] = spec.get("params", {})
+
+    rows = []
+    for summary_path in sorted(glob.glob(os.path.join(results_dir, "*", "summary.csv"))):
+        folder = os.path.basename(os.path.dirname(summary_path))
+        fallback = {**(defaults or {}), **folder_params.get(folder, {})}
+        with open(summary_path, "r", encoding="utf-8", newline="") as f:
+            for record in csv.DictReader(f):
+                if not record.get("execution_time") or not record.get("config_name"):
+                    continue
+                try:
+                    row = {key: int(float(record.get(key) or fallback[key])) for key in MODEL_PARAMS}
+                except KeyError:
+                    continue  # Parameters unknown for this folder
+                row["config_name"] = record["config_name"]
+                row["execution_time"] = float(record["execution_time"])
+                rows.append(row)
+    return rows
+
+
+def lpt_order(predicted_times: Sequence[float]) -> List[int]:
+    """Returns job indices longest-predicted-first (the LPT rule for minimizing makespan)."""
+    return sorted(range(len(predicted_times)), key=lambda i: predicted_times[i], reverse=True)
+
+
+def simulate_makespan(durations: Sequence[float], order: Sequence[int], num_workers: int) -> Tuple[float, List[float]]:
+    """
+    Simulates list scheduling: jobs are started in `order`, each on the first
+    worker to become free. Returns the makespan and the finish time of every job.
+    """
+    free_at = [(0.0, worker) for worker in range(max(1, num_workers))]
+    finish_times = [0.0] * len(durations)
+    for job in order:
+        start, worker = heapq.heappop(free_at)
+        finish_times[job] = start + durations[job]
+        heapq.heappush(free_at, (finish_times[job], worker))
+    return max(finish_times, default=0.0), finish_times
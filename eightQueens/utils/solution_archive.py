@@ -0,0 +1,135 @@
+import json
+import os
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from problem.symmetry import canonical_form
+
+
+class SolutionArchive:
+    """
+    Persistent archive of N-Queens solutions found across runs.
+
+    Solutions are stored in canonical form (smallest image under the 8 board
+    symmetries) and indexed by it, so symmetric variants of the same board
+    count as one distinct solution. Each entry records which configurations
+    and runs found it. The archive is kept as a JSON file.
+    """
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        self._entries: Dict[Tuple[int, ...], List[Dict]] = {}
+        self._load()
+
+    def _load(self):
+        """Loads a previously saved archive, if the file exists."""
+        if not os.path.exists(self.filepath):
+            return
+        with open(self.filepath, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        for entry in data:
+            self._entries[tuple(entry["solution"])] = entry["found_by"]
+
+    def add(self, chromosome: Sequence[int], config_name: str, run_id: int) -> bool:
+        """
+        Records a solution found by a run.
+
+        Returns:
+            bool: True if no symmetric variant of the board was archived before.
+        """
+        key = canonical_form(chromosome)
+        is_new = key not in self._entries
+        self._entries.setdefault(key, []).append({"config": config_name, "run_id": run_id})
+        return is_new
+
+    def lookup(self, chromosome: Sequence[int]) -> Optional[List[Dict]]:
+        """Returns the runs that found this board (or a symmetric variant), or None."""
+        return self._entries.get(canonical_form(chromosome))
+
+    def get_solution(self, n: int) -> Optional[List[int]]:
+        """Returns a known solution for an N x N board, or None if none is archived."""
+        for key in self._entries:
+            if len(key) == n:
+                return list(key)
+        return None
+
+    def count_distinct(self, n: int) -> int:
+        """Returns the number of distinct (up to symmetry) solutions archived for N."""
+        return sum(1 for key in self._entries if len(key) == n)
+
+    def boards(self, n: int) -> List[List[int]]:
+        """Returns every archived solution for an N x N board (used to warm-start runs)."""
+        return [list(key) for key in self._entries if len(key) == n]
+
+    def board_sizes(self) -> List[int]:
+        """Returns the board sizes with at least one archived solution."""
+        return sorted(set(len(key) for key in self._entries))
+
+    def counts_by_n(self) -> Dict[int, int]:
+        """Returns the number of distinct archived solutions for each board size."""
+        return dict(Counter(len(key) for key in self._entries))
+
+    def save(self):
+        """Saves the archive to its JSON file."""
+        dir_name = os.path.dirname(self.filepath)
+        if dir_name:
+            os.makedirs(dir_name, exist_ok=True)
+        data = [
+            {"n": len(key), "solution": list(key), "found_by": found_by}
+            for key, found_by in self._entries.items()
+        ]
+        with open(self.filepath, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class EliteArchive:
+    """
+    Persistent store of the best boards found by past runs, solved or not,
+    used to warm-start later runs. Up to `capacity` distinct boards with the
+    highest fitness are kept for each board size, in a JSON file.
+    """
+    def __init__(self, filepath: str, capacity: int = 10):
+        self.filepath = filepath
+        self.capacity = capacity
+        self._elites: Dict[int, List[Tuple[float, Tuple[int, ...]]]] = {}
+        if os.path.exists(filepath):
+            with open(filepath, "r", encoding="utf-8") as f:
+                for entry in json.load(f):
+                    self._elites.setdefault(len(entry["board"]), []).append(
+                        (entry["fitness"], tuple(entry["board"])))
+
+    def add(self, chromosome: Sequence[int], fitness: float) -> bool:
+        """Offers a run's best board; returns True if it was kept."""
+        board = tuple(chromosome)
+        elites = self._elites.setdefault(len(board), [])
+        if any(stored == board for _, stored in elites):
+            return False
+        elites.append((fitness, board))
+        elites.sort(key=lambda entry: entry[0], reverse=True)
+        del elites[self.capacity:]
+        return (fitness, board) in elites
+
+    def boards(self, n: int) -> List[List[int]]:
+        """Returns the stored boards for N, best first."""
+        return [list(board) for _, board in self._elites.get(n, [])]
+
+    def board_sizes(self) -> List[int]:
+        """Returns the board sizes with at least one stored board."""
+        return sorted(n for n, elites in self._elites.items() if elites)
+
+    def save(self):
+        """Saves the archive to its JSON file."""
+        dir_name = os.path.dirname(self.filepath)
+        if dir_name:
+            os.makedirs(dir_name, exist_ok=True)
+        data = [
+            {"n": n, "fitness": fitness, "board": list(board)}
+            for n, elites in sorted(self._elites.items()) for fitness, board in elites
+        ]
+        with open(self.filepath, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+    def __len__(self) -> int:
+        return sum(len(elites) for elites in self._elites.values())